@@ -0,0 +1,141 @@
+"""In-process response caching for read-heavy endpoints."""
+
+import hashlib
+import time
+from collections.abc import Hashable
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models import SyncCheckpoint
+
+settings = get_settings()
+
+
+class TTLCache:
+    """
+    Small dict-backed cache whose entries expire after a fixed time.
+
+    Each worker process keeps its own cache, which is fine for data that is
+    allowed to be a few seconds stale. When full, the oldest entry is evicted.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value for ttl seconds."""
+        if key not in self._data and len(self._data) >= self.maxsize:
+            del self._data[next(iter(self._data))]
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._data.clear()
+
+
+def set_cache_headers(response: Response, max_age: int | None = None) -> None:
+    """Let browsers and CDNs reuse a response for max_age seconds."""
+    max_age = settings.response_cache_seconds if max_age is None else max_age
+    response.headers["Cache-Control"] = (
+        f"public, max-age={max_age}, stale-while-revalidate={max_age * 2}"
+    )
+
+
+# Distinct incident categories/districts. These only change when incidents are
+# synced, so the ingestion service clears this after each sync.
+INCIDENT_LOOKUP_TTL = 300
+incident_lookup_cache = TTLCache(ttl=INCIDENT_LOOKUP_TTL)
+
+
+def make_etag(content: bytes) -> str:
+    """Strong ETag for a response body."""
+    return f'"{hashlib.md5(content, usedforsecurity=False).hexdigest()}"'
+
+
+def etag_response(request: Request, content: bytes, etag: str, max_age: int) -> Response:
+    """
+    Build a JSON response carrying an ETag.
+
+    Returns 304 Not Modified without a body when the client already holds
+    the same representation (If-None-Match).
+    """
+    if request.headers.get("if-none-match") == etag:
+        response = Response(status_code=304)
+    else:
+        response = Response(content=content, media_type="application/json")
+    response.headers["ETag"] = etag
+    set_cache_headers(response, max_age)
+    return response
+
+
+# A checkpoint's last_modified_at moves whenever its table changes (a sync
+# upserts rows or pruning deletes them), and ingestion clears this cache when
+# it does. Otherwise each worker probes at most once per LAST_MODIFIED_TTL
+# seconds however often clients poll.
+LAST_MODIFIED_TTL = 2
+last_modified_cache = TTLCache(ttl=LAST_MODIFIED_TTL)
+
+
+async def get_last_modified(db: AsyncSession, source: str) -> datetime | None:
+    """When a source's table last changed (None if never synced)."""
+    last_modified = last_modified_cache.get(source)
+    if last_modified is None:
+        result = await db.execute(
+            select(SyncCheckpoint.last_modified_at).where(SyncCheckpoint.source == source)
+        )
+        last_modified = result.scalar_one_or_none()
+        if last_modified is None:
+            return None
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=UTC)
+        # HTTP dates have one-second resolution
+        last_modified = last_modified.replace(microsecond=0)
+        last_modified_cache.set(source, last_modified)
+    return last_modified
+
+
+def not_modified_response(request: Request, last_modified: datetime | None) -> Response | None:
+    """
+    Return 304 Not Modified if the client's copy is still current, else None.
+
+    Compares If-Modified-Since against the source's Last-Modified time.
+    """
+    if_modified_since = request.headers.get("if-modified-since")
+    if last_modified is None or not if_modified_since:
+        return None
+    try:
+        client_time = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return None
+    if client_time.tzinfo is None or last_modified > client_time:
+        return None
+
+    response = Response(status_code=304)
+    set_last_modified(response, last_modified)
+    set_cache_headers(response)
+    return response
+
+
+def set_last_modified(response: Response, last_modified: datetime | None) -> None:
+    """Add a Last-Modified header when the source has been synced."""
+    if last_modified is not None:
+        response.headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
@@ -1,6 +1,6 @@
 """Application configuration using Pydantic settings."""
 
-from functools import lru_cache
+from functools import cache
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -17,9 +17,28 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "postgresql+asyncpg://localhost:5432/sfcrime"
 
+    # Connection pool (per worker process, see database.py for sizing)
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 30  # Seconds to wait for a free connection
+    db_pool_recycle: int = 1800  # Seconds before a pooled connection is replaced
+    db_pool_pre_ping: bool = False  # SELECT 1 on every checkout; enable for flaky networks
+    db_connect_timeout: int = 10  # Seconds to establish a new connection
+    # Set when database_url points at PgBouncer (or Neon's pooled endpoint) in
+    # transaction mode: disables client-side pooling and prepared statement caching.
+    db_pgbouncer: bool = False
+
     # Diachron integration (optional - enables historical context)
     diachron_database_url: str | None = None  # Separate DB or same as database_url
     diachron_enabled: bool = False  # Set to True to enable dual-write
+    # Worker processes for converting large (backfill-sized) batches to facts;
+    # 0 converts in the event loop process
+    diachron_convert_workers: int = 0
+    # Writer pool (asyncpg, per worker process)
+    diachron_pool_min_size: int = 2
+    diachron_pool_max_size: int = 10
+    diachron_pool_max_idle: float = 300.0  # Seconds before an idle connection is closed
+    diachron_command_timeout: float = 30.0
 
     # DataSF SODA API
     soda_app_token: str | None = None  # Optional but recommended for higher rate limits
@@ -42,13 +61,20 @@ class Settings(BaseSettings):
     # API settings
     api_v1_prefix: str = "/api/v1"
     cors_origins: list[str] = ["*"]  # Restrict in production
+    cors_origin_regex: str | None = None  # e.g. r"^https://(app|staging)\.example\.com$"
     rate_limit_per_minute: int = 60
+    response_cache_seconds: int = 30  # Viewport cache TTL and Cache-Control max-age
+    # Counter storage for the rate limiter. "memory://" keeps counters per worker
+    # process; use e.g. "redis://host:6379" to share them across workers.
+    rate_limit_storage_uri: str = "memory://"
+    # Responses at least this many bytes are gzipped for clients that accept it
+    gzip_minimum_size: int = 1000
 
     # Environment
     debug: bool = False
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
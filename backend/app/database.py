@@ -1,22 +1,77 @@
 """Database setup with SQLAlchemy async and PostGIS support."""
 
+import asyncio
 from collections.abc import AsyncGenerator
+from typing import Any
+from uuid import uuid4
 
+import orjson
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 
-from app.config import get_settings
+from app.config import Settings, get_settings
 
 settings = get_settings()
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-)
+
+def _json_dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+
+
+def _prepared_statement_name() -> str:
+    """Globally unique name, so statements never collide on a shared server connection."""
+    return f"__asyncpg_{uuid4()}__"
+
+
+def _engine_options(settings: Settings) -> dict[str, Any]:
+    """Keyword arguments for create_async_engine under the given settings."""
+    # Stale connections are handled by pool_recycle plus server-side TCP keepalives
+    # rather than pool_pre_ping, which would cost a round-trip on every checkout.
+    connect_args: dict[str, Any] = {
+        "timeout": settings.db_connect_timeout,
+        "server_settings": {"tcp_keepalives_idle": "60"},
+    }
+    options: dict[str, Any] = {
+        "echo": settings.debug,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "connect_args": connect_args,
+        # The asyncpg dialect registers these as per-connection json/jsonb type
+        # codecs, so values are decoded inside asyncpg's fetch loop.
+        "json_serializer": _json_dumps,
+        "json_deserializer": orjson.loads,
+    }
+
+    if settings.db_pgbouncer:
+        # PgBouncer multiplexes server connections across transactions, so pooling
+        # here would only double-pool, and prepared statements can't outlive a
+        # transaction - disable both asyncpg's and SQLAlchemy's statement caches.
+        # The dialect still prepares each statement, under asyncpg's per-connection
+        # __asyncpg_stmt_N__ names that collide between clients sharing a server
+        # connection, so give every statement a unique name instead.
+        options["poolclass"] = NullPool
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = _prepared_statement_name
+        connect_args["server_settings"]["jit"] = "off"
+    else:
+        # Each uvicorn worker owns its own pool, so the sizing rule is:
+        #   workers * (pool_size + max_overflow) <= pg max_connections - reserved
+        # Hot endpoints run a small, fixed set of statements (see the module-level
+        # text() constants in the routers); keep their prepared plans per connection.
+        connect_args["statement_cache_size"] = 512
+        connect_args["prepared_statement_cache_size"] = 512
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+    return options
+
+
+engine = create_async_engine(settings.database_url, **_engine_options(settings))
 
 async_session_maker = async_sessionmaker(
     engine,
@@ -32,11 +87,15 @@ class Base(DeclarativeBase):
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency to get database session."""
+    """
+    Dependency to get database session.
+
+    Does not commit: read-only requests end with a rollback on close, and
+    endpoints (or services) that write must call `await session.commit()`.
+    """
     async with async_session_maker() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -61,38 +120,51 @@ async def check_db_ready() -> None:
     """
     Verify database connectivity and expected schema.
 
-    Checks that PostGIS is enabled and required tables exist.
+    Checks that PostGIS is enabled and required tables exist, in a single
+    round-trip.
     """
     async with engine.connect() as conn:
-        await conn.execute(text("SELECT 1"))
-
-        # PostGIS is required for spatial queries.
-        postgis = await conn.execute(
-            text("SELECT 1 FROM pg_extension WHERE extname = 'postgis' LIMIT 1")
-        )
-        if postgis.first() is None:
-            raise RuntimeError("PostGIS extension is not installed.")
-
-        # Tables should exist.
-        tables = await conn.execute(
+        result = await conn.execute(
             text(
                 "SELECT "
                 "to_regclass('public.dispatch_calls') AS dispatch_calls, "
                 "to_regclass('public.incident_reports') AS incident_reports, "
-                "to_regclass('public.sync_checkpoints') AS sync_checkpoints"
+                "to_regclass('public.sync_checkpoints') AS sync_checkpoints, "
+                "EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'postgis') "
+                "AS has_postgis"
             )
         )
-        row = tables.first()
-        if row is None or any(value is None for value in row):
-            missing = []
-            if row is None or row.dispatch_calls is None:
-                missing.append("dispatch_calls")
-            if row is None or row.incident_reports is None:
-                missing.append("incident_reports")
-            if row is None or row.sync_checkpoints is None:
-                missing.append("sync_checkpoints")
-
-            raise RuntimeError(
-                f"Database schema is missing tables: {', '.join(missing)} "
-                "(run database init or check migrations)."
-            )
+        row = result.one()
+
+    # PostGIS is required for spatial queries.
+    if not row.has_postgis:
+        raise RuntimeError("PostGIS extension is not installed.")
+
+    # Tables should exist.
+    missing = [
+        table
+        for table in ("dispatch_calls", "incident_reports", "sync_checkpoints")
+        if getattr(row, table) is None
+    ]
+    if missing:
+        raise RuntimeError(
+            f"Database schema is missing tables: {', '.join(missing)} "
+            "(run database init or check migrations)."
+        )
+
+
+async def warm_pool() -> None:
+    """
+    Open pool_size connections before serving traffic.
+
+    Without this the first burst of requests after a cold start races to open
+    connections concurrently. No-op in PgBouncer mode, where there is no pool.
+    """
+    if settings.db_pgbouncer:
+        return
+
+    async def _touch() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_touch() for _ in range(settings.db_pool_size)))
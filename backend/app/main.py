@@ -1,56 +1,80 @@
 """FastAPI application for SFCrime backend."""
 
 import logging
+import queue
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
 from app.config import get_settings
-from app.database import check_db_ready
-from app.routers import calls_router, health_router, incidents_router
+from app.database import check_db_ready, warm_pool
+from app.routers import calls_router, health_router, incidents_router, tiles_router
+from app.services.ingestion import shutdown_convert_pool
 from app.tasks.scheduler import setup_scheduler, shutdown_scheduler
 from app.websocket import websocket_router
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+# Configure logging. QueueHandler.prepare() still formats each record in the
+# thread that logs it; only the blocking write to stderr moves to the
+# listener's background thread, which runs for the app's lifespan. Records
+# logged before it starts wait in the queue.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False
+
+_log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+_log_listener = QueueListener(_log_queue, _log_handler)
+logging.root.addHandler(QueueHandler(_log_queue))
+logging.root.setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
-# Rate limiter
-limiter = Limiter(key_func=get_remote_address)
+# Rate limiter (counters are per-process unless a shared storage URI is set)
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.rate_limit_storage_uri,
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan management."""
-    logger.info("Starting SFCrime backend...")
-
-    # Verify database is ready
+    _log_listener.start()
     try:
-        await check_db_ready()
-        logger.info("Database ready")
-    except Exception as e:
-        logger.error(f"Database not ready: {e}")
-        raise
+        logger.info("Starting SFCrime backend...")
 
-    # Start scheduler (ingestion) once DB is ready.
-    setup_scheduler()
-    logger.info("Scheduler started")
+        # Verify database is ready
+        try:
+            await check_db_ready()
+            await warm_pool()
+            logger.info("Database ready")
+        except Exception as e:
+            logger.error(f"Database not ready: {e}")
+            raise
 
-    yield
+        # Start scheduler (ingestion) once DB is ready.
+        setup_scheduler()
+        logger.info("Scheduler started")
 
-    # Shutdown
-    shutdown_scheduler()
-    logger.info("SFCrime backend shut down")
+        yield
+
+        # Shutdown
+        shutdown_scheduler()
+        shutdown_convert_pool()
+        logger.info("SFCrime backend shut down")
+    finally:
+        # Flushes queued records before the process exits
+        _log_listener.stop()
 
 
 # Create FastAPI app
@@ -59,19 +83,27 @@ app = FastAPI(
     description="Live crime map API for San Francisco - powered by DataSF",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add rate limiter
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
-# Add CORS middleware
+# Compress JSON list and tile payloads. Repeated field names make map-layer
+# responses shrink several-fold; level 5 keeps the CPU cost per request low.
+app.add_middleware(GZipMiddleware, minimum_size=settings.gzip_minimum_size, compresslevel=5)
+
+# Add CORS middleware. Keep this the last add_middleware call: Starlette runs
+# middleware in reverse registration order, so preflight requests are answered
+# before reaching anything else in the stack.
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
+    allow_origin_regex=settings.cors_origin_regex,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
 
@@ -80,7 +112,7 @@ app.add_middleware(
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle unhandled exceptions."""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"detail": "Internal server error"},
     )
@@ -90,18 +122,21 @@ async def global_exception_handler(request: Request, exc: Exception):
 app.include_router(health_router)
 app.include_router(calls_router, prefix=settings.api_v1_prefix)
 app.include_router(incidents_router, prefix=settings.api_v1_prefix)
+app.include_router(tiles_router, prefix=settings.api_v1_prefix)
 app.include_router(websocket_router)  # WebSocket at /ws/calls
 
 
 @app.get("/")
-async def root():
+async def root() -> ORJSONResponse:
     """Root endpoint with API info."""
-    return {
-        "name": "SFCrime API",
-        "version": "0.1.0",
-        "docs": "/docs",
-        "health": "/health",
-    }
+    return ORJSONResponse(
+        {
+            "name": "SFCrime API",
+            "version": "0.1.0",
+            "docs": "/docs",
+            "health": "/health",
+        }
+    )
 
 
 if __name__ == "__main__":
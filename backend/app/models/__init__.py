@@ -1,5 +1,7 @@
 """Database models."""
 
+from sqlalchemy.orm import configure_mappers
+
 from app.models.dispatch_call import DispatchCall
 from app.models.fire_call import FireCall
 from app.models.incident_report import IncidentReport
@@ -15,3 +17,6 @@ __all__ = [
     "SyncCheckpoint",
     "TrafficCrash",
 ]
+
+# Resolve mapper configuration at import time rather than on the first query
+configure_mappers()
@@ -3,7 +3,7 @@
 from datetime import datetime
 
 from geoalchemy2 import Geometry
-from sqlalchemy import DateTime, Index, String, func
+from sqlalchemy import Computed, DateTime, Double, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -15,6 +15,10 @@ class DispatchCall(Base):
 
     Represents 911 calls as they happen with 10-15 minute delay.
     Rolling 48-hour retention window.
+
+    The table is UNLOGGED: writes skip the WAL, and Postgres truncates it after
+    a crash. That is acceptable because DataSF is the source of truth and the
+    next sync refetches the full 48-hour window into an empty table.
     """
 
     __tablename__ = "dispatch_calls"
@@ -25,7 +29,7 @@ class DispatchCall(Base):
     # Call classification
     call_type_code: Mapped[str | None] = mapped_column(String(20))
     call_type_description: Mapped[str | None] = mapped_column(String(255))
-    priority: Mapped[str | None] = mapped_column(String(1), index=True)  # A, B, or C
+    priority: Mapped[str | None] = mapped_column(String(1))  # A, B, or C
 
     # Timestamps
     received_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -33,25 +37,37 @@ class DispatchCall(Base):
     on_scene_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     closed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
-    # Location (PostGIS geometry for efficient viewport queries)
-    location: Mapped[str | None] = mapped_column(Geometry("POINT", srid=4326))
+    # Location (PostGIS geometry, tuned for viewport queries). Filter with
+    # `location && ST_MakeEnvelope(...)` so the spatial index is used; casting the
+    # column (e.g. `location::geography` for ST_DWithin) bypasses the index.
+    location: Mapped[str | None] = mapped_column(
+        Geometry("POINT", srid=4326, spatial_index=False)  # Indexed below
+    )
     location_text: Mapped[str | None] = mapped_column(String(255))  # Human-readable intersection
+    # Stored copies of the point's coordinates, so reads skip geometry decoding
+    lat: Mapped[float | None] = mapped_column(Double, Computed("ST_Y(location)", persisted=True))
+    lng: Mapped[float | None] = mapped_column(Double, Computed("ST_X(location)", persisted=True))
 
     # Administrative
-    district: Mapped[str | None] = mapped_column(String(50), index=True)
+    district: Mapped[str | None] = mapped_column(String(50))
     disposition: Mapped[str | None] = mapped_column(String(20))
 
     # Sync tracking
-    last_updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), index=True)
+    last_updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     __table_args__ = (
-        # Spatial index for bounding box queries
-        Index("idx_calls_location", location, postgresql_using="gist"),
+        # SP-GiST (quad-tree) index for bounding box (&&) queries on points
+        Index("idx_calls_location_spgist", location, postgresql_using="spgist"),
+        # Incremental sync scans (WHERE last_updated_at > :cursor ORDER BY last_updated_at, id)
+        Index("idx_calls_sync", last_updated_at, id),
         # Cursor pagination index
         Index("idx_calls_cursor", received_at.desc(), id.desc()),
+        # Priority filter + keyset pagination (GET /calls?priority=...&cursor=...)
+        Index("idx_calls_filter", priority, received_at.desc(), id.desc()),
+        {"prefixes": ["UNLOGGED"]},
     )
 
     def __repr__(self) -> str:
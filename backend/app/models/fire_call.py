@@ -26,7 +26,7 @@ class FireCall(Base):
     # Call classification
     call_type: Mapped[str | None] = mapped_column(String(100))
     call_type_group: Mapped[str | None] = mapped_column(String(50))  # Life-threatening, Non Life-threatening
-    priority: Mapped[str | None] = mapped_column(String(1), index=True)  # 1, 2, 3 (1 is highest)
+    priority: Mapped[str | None] = mapped_column(String(1))  # 1, 2, 3 (1 is highest)
     number_of_alarms: Mapped[int | None] = mapped_column(Integer)
 
     # Timestamps
@@ -40,7 +40,9 @@ class FireCall(Base):
     # Disposition
     disposition: Mapped[str | None] = mapped_column(String(100))
 
-    # Location (PostGIS geometry for efficient viewport queries)
+    # Location (PostGIS geometry, tuned for viewport queries). Filter with
+    # `location && ST_MakeEnvelope(...)` so the spatial index is used; casting the
+    # column (e.g. `location::geography` for ST_DWithin) bypasses the index.
     location: Mapped[str | None] = mapped_column(Geometry("POINT", srid=4326))
     location_text: Mapped[str | None] = mapped_column(String(255))  # Human-readable address
     zipcode: Mapped[str | None] = mapped_column(String(10))
@@ -56,7 +58,7 @@ class FireCall(Base):
     is_als_unit: Mapped[bool | None] = mapped_column(Boolean)  # Advanced Life Support
 
     # Sync tracking
-    last_updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), index=True)
+    last_updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -64,8 +66,19 @@ class FireCall(Base):
     __table_args__ = (
         # Spatial index for bounding box queries
         Index("idx_fire_calls_location", location, postgresql_using="gist"),
+        # Incremental sync scans (WHERE last_updated_at > :cursor ORDER BY last_updated_at, id)
+        Index("idx_fire_calls_sync", last_updated_at, id),
         # Cursor pagination index
         Index("idx_fire_calls_cursor", received_at.desc(), id.desc()),
+        # Priority filter + recency sort
+        Index("idx_fire_calls_filter", priority, received_at.desc()),
+        # BRIN index for long range scans over historical calls
+        Index(
+            "idx_fire_calls_received_brin",
+            received_at,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
         # Call type index for filtering
         Index("idx_fire_calls_type", call_type),
     )
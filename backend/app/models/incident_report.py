@@ -3,7 +3,8 @@
 from datetime import date, datetime, time
 
 from geoalchemy2 import Geometry
-from sqlalchemy import Date, DateTime, Index, String, Time, func
+from sqlalchemy import Computed, Date, DateTime, Double, Index, String, Time, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -19,6 +20,16 @@ class IncidentReport(Base):
 
     __tablename__ = "incident_reports"
 
+    # Text indexed for GET /incidents/search?q=...
+    SEARCH_TSV_EXPRESSION = (
+        "to_tsvector('english', "
+        "coalesce(incident_category, '') || ' ' || "
+        "coalesce(incident_subcategory, '') || ' ' || "
+        "coalesce(incident_description, '') || ' ' || "
+        "coalesce(location_text, '') || ' ' || "
+        "coalesce(analysis_neighborhood, ''))"
+    )
+
     id: Mapped[int] = mapped_column(primary_key=True)
     incident_id: Mapped[str] = mapped_column(String(20), unique=True, nullable=False)
     incident_number: Mapped[str | None] = mapped_column(String(20))
@@ -34,24 +45,45 @@ class IncidentReport(Base):
     incident_time: Mapped[time | None] = mapped_column(Time)
     report_datetime: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
 
-    # Location (PostGIS geometry for map queries)
-    location: Mapped[str | None] = mapped_column(Geometry("POINT", srid=4326))
+    # Location (PostGIS geometry, tuned for viewport queries). Filter with
+    # `location && ST_MakeEnvelope(...)` so the spatial index is used; casting the
+    # column (e.g. `location::geography` for ST_DWithin) bypasses the index.
+    location: Mapped[str | None] = mapped_column(
+        Geometry("POINT", srid=4326, spatial_index=False)  # Indexed below
+    )
     location_text: Mapped[str | None] = mapped_column(String(255))  # Human-readable address
+    # Stored copies of the point's coordinates, so reads skip geometry decoding
+    lat: Mapped[float | None] = mapped_column(Double, Computed("ST_Y(location)", persisted=True))
+    lng: Mapped[float | None] = mapped_column(Double, Computed("ST_X(location)", persisted=True))
 
     # Administrative
     police_district: Mapped[str | None] = mapped_column(String(50), index=True)
     analysis_neighborhood: Mapped[str | None] = mapped_column(String(100))
 
+    # Full-text search document (query with `search_tsv @@ websearch_to_tsquery(...)`)
+    search_tsv: Mapped[str | None] = mapped_column(
+        TSVECTOR, Computed(SEARCH_TSV_EXPRESSION, persisted=True), deferred=True
+    )
+
     # Metadata
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     __table_args__ = (
-        # Spatial index
-        Index("idx_reports_location", location, postgresql_using="gist"),
-        # Cursor pagination index
-        Index("idx_reports_cursor", report_datetime.desc(), id.desc()),
+        # SP-GiST (quad-tree) index for bounding box (&&) queries on points
+        Index("idx_reports_location_spgist", location, postgresql_using="spgist"),
+        # Cursor pagination index, matching the search sort order
+        Index("idx_reports_cursor", report_datetime.desc().nulls_last(), id.desc()),
+        Index("idx_reports_search", search_tsv, postgresql_using="gin"),
+        # Append-only history is stored in roughly date order, so a BRIN index
+        # serves month/year range scans at a fraction of a btree's size
+        Index(
+            "idx_reports_date_brin",
+            incident_date,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -70,7 +70,7 @@ class ServiceRequest(Base):
     __table_args__ = (
         Index("ix_service_requests_service_name", "service_name"),
         Index("ix_service_requests_status", "status_description"),
-        Index("ix_service_requests_last_updated_at", "last_updated_at"),
+        Index("idx_service_requests_sync", "last_updated_at", "id"),
         Index("idx_service_requests_location", "location", postgresql_using="gist"),
         Index(
             "idx_service_requests_cursor",
@@ -23,6 +23,10 @@ class SyncCheckpoint(Base):
     last_sync_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+    # When the source's table last changed: synced rows or pruned ones
+    last_modified_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
     record_count: Mapped[int] = mapped_column(Integer, server_default="0", nullable=False)
 
     def __repr__(self) -> str:
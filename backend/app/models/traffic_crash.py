@@ -71,11 +71,17 @@ class TrafficCrash(Base):
 
     __table_args__ = (
         Index("ix_traffic_crashes_type", "type_of_collision"),
-        Index("ix_traffic_crashes_last_updated_at", "last_updated_at"),
+        Index("idx_traffic_crashes_sync", "last_updated_at", "id"),
         Index("idx_traffic_crashes_location", "location", postgresql_using="gist"),
         Index(
             "idx_traffic_crashes_cursor",
             collision_datetime.desc(),
             id.desc(),
         ),
+        Index(
+            "idx_traffic_crashes_datetime_brin",
+            collision_datetime,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
     )
@@ -0,0 +1,43 @@
+"""Opaque cursors for keyset pagination over (timestamp, id)."""
+
+import base64
+import struct
+from datetime import UTC, datetime, timedelta
+
+# version, flags, microseconds since the epoch, row id
+_CURSOR = struct.Struct(">BBqI")
+_CURSOR_VERSION = 1
+_FLAG_AWARE = 0x01
+
+_EPOCH_AWARE = datetime(1970, 1, 1, tzinfo=UTC)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def encode_cursor(timestamp: datetime, id: int) -> str:
+    """Pack a (timestamp, id) position into a short URL-safe string."""
+    if timestamp.tzinfo is None:
+        flags, epoch = 0, _EPOCH_NAIVE
+    else:
+        flags, epoch = _FLAG_AWARE, _EPOCH_AWARE
+    micros = (timestamp - epoch) // _ONE_MICROSECOND
+    packed = _CURSOR.pack(_CURSOR_VERSION, flags, micros, id)
+    return base64.urlsafe_b64encode(packed).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Unpack a cursor produced by encode_cursor.
+
+    Raises ValueError for anything that is not a current-version cursor.
+    """
+    try:
+        packed = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        version, flags, micros, id = _CURSOR.unpack(packed)
+    except (ValueError, struct.error) as e:
+        raise ValueError(f"Malformed cursor: {cursor!r}") from e
+    if version != _CURSOR_VERSION:
+        raise ValueError(f"Unsupported cursor version: {version}")
+
+    epoch = _EPOCH_AWARE if flags & _FLAG_AWARE else _EPOCH_NAIVE
+    return epoch + micros * _ONE_MICROSECOND, id
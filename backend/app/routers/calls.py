@@ -1,123 +1,169 @@
 """API routes for live dispatch calls."""
 
-import base64
 import logging
-from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy import Row, select, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import (
+    TTLCache,
+    get_last_modified,
+    not_modified_response,
+    set_cache_headers,
+    set_last_modified,
+)
+from app.config import get_settings
 from app.database import get_db
 from app.models import DispatchCall
-from app.schemas.dispatch_call import Coordinates, DispatchCallOut, DispatchCallsResponse
+from app.pagination import decode_cursor, encode_cursor
+from app.schemas.dispatch_call import (
+    Coordinates,
+    DispatchCallOut,
+    DispatchCallsResponse,
+    dump_calls_json,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/calls", tags=["calls"])
-
-
-def _encode_cursor(received_at: datetime, id: int) -> str:
-    """Encode cursor for keyset pagination."""
-    cursor_str = f"{received_at.isoformat()}|{id}"
-    return base64.urlsafe_b64encode(cursor_str.encode()).decode()
-
-
-def _decode_cursor(cursor: str) -> tuple[datetime, int]:
-    """Decode cursor for keyset pagination."""
-    cursor_str = base64.urlsafe_b64decode(cursor.encode()).decode()
-    parts = cursor_str.split("|")
-    received_at = datetime.fromisoformat(parts[0])
-    id = int(parts[1])
-    return received_at, id
+settings = get_settings()
+
+# Map clients poll the same viewports repeatedly; holds serialized responses
+_bbox_cache = TTLCache(ttl=settings.response_cache_seconds)
+
+# Columns needed for DispatchCallOut. Selecting them as plain row tuples skips
+# ORM entity construction and identity-map bookkeeping for every row, and
+# coordinates come from the stored lat/lng columns rather than the WKB column.
+_CALL_COLUMNS = (
+    DispatchCall.id,
+    DispatchCall.cad_number,
+    DispatchCall.call_type_code,
+    DispatchCall.call_type_description,
+    DispatchCall.priority,
+    DispatchCall.received_at,
+    DispatchCall.dispatch_at,
+    DispatchCall.on_scene_at,
+    DispatchCall.closed_at,
+    DispatchCall.lat,
+    DispatchCall.lng,
+    DispatchCall.location_text,
+    DispatchCall.district,
+    DispatchCall.disposition,
+)
+
+# Use raw SQL for better compatibility with Neon PostgreSQL + PostGIS. Built
+# once so asyncpg's prepared statement cache can reuse the server-side plan.
+_BBOX_SQL = text("""
+    SELECT
+        id, cad_number, call_type_code, call_type_description, priority,
+        received_at, dispatch_at, on_scene_at, closed_at,
+        lat, lng,
+        location_text, district, disposition
+    FROM dispatch_calls
+    WHERE location && ST_MakeEnvelope(:min_lng, :min_lat, :max_lng, :max_lat, 4326)
+    ORDER BY received_at DESC
+    LIMIT :limit
+""")
+
+
+def _call_out(row: Row) -> DispatchCallOut:
+    """Build a DispatchCallOut from a row of call columns without re-validation."""
+    coords = (
+        Coordinates.model_construct(latitude=float(row.lat), longitude=float(row.lng))
+        if row.lat is not None and row.lng is not None
+        else None
+    )
+    return DispatchCallOut.model_construct(
+        id=row.id,
+        cad_number=row.cad_number,
+        call_type_code=row.call_type_code,
+        call_type_description=row.call_type_description,
+        priority=row.priority,
+        received_at=row.received_at,
+        dispatch_at=row.dispatch_at,
+        on_scene_at=row.on_scene_at,
+        closed_at=row.closed_at,
+        coordinates=coords,
+        location_text=row.location_text,
+        district=row.district,
+        disposition=row.disposition,
+    )
 
 
 @router.get("", response_model=DispatchCallsResponse)
 async def list_calls(
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
     cursor: str | None = None,
     limit: int = Query(50, ge=1, le=200),
     priority: list[str] | None = Query(None, description="Filter by priority (A, B, C)"),
-) -> DispatchCallsResponse:
+) -> Response:
     """
     List dispatch calls from the last 48 hours with cursor pagination.
 
     Cursor-based pagination is used for efficient pagination over large datasets.
     The cursor is an opaque string that encodes the position in the result set.
+    Pollers can send If-Modified-Since to get 304 until the next sync lands.
     """
+    last_modified = await get_last_modified(db, "dispatch_calls")
+    if (not_modified := not_modified_response(request, last_modified)) is not None:
+        return not_modified
+
     # Build query
-    query = select(
-        DispatchCall,
-        func.ST_Y(DispatchCall.location).label("lat"),
-        func.ST_X(DispatchCall.location).label("lng"),
-    ).order_by(
-        DispatchCall.received_at.desc(),
-        DispatchCall.id.desc(),
+    query = (
+        select(*_CALL_COLUMNS)
+        .order_by(
+            DispatchCall.received_at.desc(),
+            DispatchCall.id.desc(),
+        )
     )
 
     # Apply cursor filter
     if cursor:
         try:
-            cursor_time, cursor_id = _decode_cursor(cursor)
+            cursor_time, cursor_id = decode_cursor(cursor)
+            # Row-value comparison is a single range condition on idx_calls_cursor
             query = query.where(
-                (DispatchCall.received_at < cursor_time)
-                | ((DispatchCall.received_at == cursor_time) & (DispatchCall.id < cursor_id))
+                tuple_(DispatchCall.received_at, DispatchCall.id) < (cursor_time, cursor_id)
             )
         except Exception:
             logger.warning(f"Invalid cursor: {cursor}")
 
-    # Apply priority filter
-    if priority:
+    # Apply priority filter. A single priority is an equality on the leading
+    # column of idx_calls_filter, so the scan comes back already in keyset order.
+    if priority and len(priority) == 1:
+        query = query.where(DispatchCall.priority == priority[0])
+    elif priority:
         query = query.where(DispatchCall.priority.in_(priority))
 
     # Fetch records
     query = query.limit(limit + 1)  # Fetch one extra to check for next page
     result = await db.execute(query)
-    rows = list(result.all())
+    calls = result.all()
 
     # Determine if there's a next page
-    has_next = len(rows) > limit
+    has_next = len(calls) > limit
     if has_next:
-        rows = rows[:limit]
-
-    # Build response
-    call_schemas = []
-    for row in rows:
-        call = row[0]
-        lat = row[1]
-        lng = row[2]
-        coords = None
-        if lat is not None and lng is not None:
-            coords = Coordinates(latitude=float(lat), longitude=float(lng))
-
-        call_schemas.append(
-            DispatchCallOut(
-                id=call.id,
-                cad_number=call.cad_number,
-                call_type_code=call.call_type_code,
-                call_type_description=call.call_type_description,
-                priority=call.priority,
-                received_at=call.received_at,
-                dispatch_at=call.dispatch_at,
-                on_scene_at=call.on_scene_at,
-                closed_at=call.closed_at,
-                coordinates=coords,
-                location_text=call.location_text,
-                district=call.district,
-                disposition=call.disposition,
-            )
-        )
+        calls = calls[:limit]
+
+    # Build response (values come from typed columns, so skip re-validation)
+    call_schemas = [_call_out(call) for call in calls]
 
     # Generate next cursor
     next_cursor = None
-    if has_next and rows:
-        last_call = rows[-1][0]
-        next_cursor = _encode_cursor(last_call.received_at, last_call.id)
+    if has_next and calls:
+        last_call = calls[-1]
+        next_cursor = encode_cursor(last_call.received_at, last_call.id)
 
-    return DispatchCallsResponse(
+    payload = DispatchCallsResponse.model_construct(
         calls=call_schemas,
         next_cursor=next_cursor,
     )
+    response = Response(content=payload.model_dump_json(), media_type="application/json")
+    set_cache_headers(response)
+    set_last_modified(response, last_modified)
+    return response
 
 
 @router.get("/bbox", response_model=list[DispatchCallOut])
@@ -128,32 +174,34 @@ async def calls_in_bbox(
     max_lat: float = Query(..., ge=-90, le=90),
     max_lng: float = Query(..., ge=-180, le=180),
     limit: int = Query(200, ge=1, le=500),
-) -> list[DispatchCallOut]:
+) -> Response:
     """
     Get dispatch calls within a map viewport bounding box.
 
     Used for efficient map rendering - only fetches visible calls.
     """
-    from sqlalchemy import text
-
-    # Use raw SQL for better compatibility with Neon PostgreSQL + PostGIS
-    sql = text("""
-        SELECT
-            id, cad_number, call_type_code, call_type_description, priority,
-            received_at, dispatch_at, on_scene_at, closed_at,
-            ST_Y(location::geometry) as lat,
-            ST_X(location::geometry) as lng,
-            location_text, district, disposition
-        FROM dispatch_calls
-        WHERE location IS NOT NULL
-          AND ST_Y(location::geometry) BETWEEN :min_lat AND :max_lat
-          AND ST_X(location::geometry) BETWEEN :min_lng AND :max_lng
-        ORDER BY received_at DESC
-        LIMIT :limit
-    """)
-
+    cache_key = (min_lat, min_lng, max_lat, max_lng, limit)
+    content = _bbox_cache.get(cache_key)
+    if content is None:
+        content = await _fetch_bbox_json(db, min_lat, min_lng, max_lat, max_lng, limit)
+        _bbox_cache.set(cache_key, content)
+
+    response = Response(content=content, media_type="application/json")
+    set_cache_headers(response)
+    return response
+
+
+async def _fetch_bbox_json(
+    db: AsyncSession,
+    min_lat: float,
+    min_lng: float,
+    max_lat: float,
+    max_lng: float,
+    limit: int,
+) -> bytes:
+    """Query calls in a bounding box and serialize them to JSON."""
     result = await db.execute(
-        sql,
+        _BBOX_SQL,
         {
             "min_lat": min_lat,
             "max_lat": max_lat,
@@ -162,35 +210,12 @@ async def calls_in_bbox(
             "limit": limit,
         },
     )
-    rows = result.fetchall()
-
-    calls = []
-    for row in rows:
-        coords = (
-            Coordinates(latitude=float(row.lat), longitude=float(row.lng))
-            if row.lat is not None and row.lng is not None
-            else None
-        )
 
-        calls.append(
-            DispatchCallOut(
-                id=row.id,
-                cad_number=row.cad_number,
-                call_type_code=row.call_type_code,
-                call_type_description=row.call_type_description,
-                priority=row.priority,
-                received_at=row.received_at,
-                dispatch_at=row.dispatch_at,
-                on_scene_at=row.on_scene_at,
-                closed_at=row.closed_at,
-                coordinates=coords,
-                location_text=row.location_text,
-                district=row.district,
-                disposition=row.disposition,
-            )
-        )
+    calls = [_call_out(row) for row in result]
 
-    return calls
+    # Serialized by pydantic-core in one pass, skipping FastAPI's model -> dict
+    # -> JSON round trip; response_model still documents the shape.
+    return dump_calls_json(calls)
 
 
 @router.get("/{cad_number}", response_model=DispatchCallOut)
@@ -199,41 +224,13 @@ async def get_call(
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> DispatchCallOut:
     """Get a specific dispatch call by CAD number."""
-    query = select(
-        DispatchCall,
-        func.ST_Y(DispatchCall.location).label("lat"),
-        func.ST_X(DispatchCall.location).label("lng"),
-    ).where(DispatchCall.cad_number == cad_number)
+    query = select(*_CALL_COLUMNS).where(DispatchCall.cad_number == cad_number)
 
     result = await db.execute(query)
-    row = result.first()
+    call = result.one_or_none()
 
-    if not row:
+    if not call:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Call not found")
 
-    call = row[0]
-    lat = row[1]
-    lng = row[2]
-
-    coords = (
-        Coordinates(latitude=float(lat), longitude=float(lng))
-        if lat is not None and lng is not None
-        else None
-    )
-
-    return DispatchCallOut(
-        id=call.id,
-        cad_number=call.cad_number,
-        call_type_code=call.call_type_code,
-        call_type_description=call.call_type_description,
-        priority=call.priority,
-        received_at=call.received_at,
-        dispatch_at=call.dispatch_at,
-        on_scene_at=call.on_scene_at,
-        closed_at=call.closed_at,
-        coordinates=coords,
-        location_text=call.location_text,
-        district=call.district,
-        disposition=call.disposition,
-    )
+    return _call_out(call)
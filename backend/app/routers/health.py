@@ -5,7 +5,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel
-from sqlalchemy import func, select
+from sqlalchemy import func, null, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -33,67 +33,80 @@ class HealthResponse(BaseModel):
     incident_reports: DataSourceStatus
 
 
+async def _estimated_counts(db: AsyncSession) -> dict[str, int]:
+    """Planner row estimates from pg_class (kept current by autovacuum/ANALYZE)."""
+    result = await db.execute(
+        text(
+            "SELECT relname, reltuples::bigint AS estimate FROM pg_class "
+            "WHERE relname IN ('dispatch_calls', 'incident_reports')"
+        )
+    )
+    # reltuples is -1 for tables that have never been analyzed
+    return {row.relname: max(row.estimate, 0) for row in result}
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check(
     db: Annotated[AsyncSession, Depends(get_db)],
+    exact: bool = Query(False, description="Use exact COUNT(*) record counts"),
 ) -> HealthResponse:
     """
     Health check endpoint with ingestion status.
 
-    Returns sync timestamps and record counts for each data source.
+    Returns sync timestamps and record counts for each data source. Record
+    counts are approximate (from table statistics) unless exact=true, since
+    COUNT(*) scans the whole incidents table on every probe.
     """
-    # Get dispatch calls status
-    dispatch_checkpoint = await db.execute(
-        select(SyncCheckpoint).where(SyncCheckpoint.source == "dispatch_calls")
-    )
-    dispatch_cp = dispatch_checkpoint.scalar_one_or_none()
-
-    dispatch_count_result = await db.execute(select(func.count(DispatchCall.id)))
-    dispatch_count = dispatch_count_result.scalar() or 0
-
-    dispatch_oldest_result = await db.execute(
-        select(func.min(DispatchCall.received_at))
+    # Estimates come from the Postgres catalog; other backends count exactly
+    exact = exact or db.get_bind().dialect.name != "postgresql"
+    estimates = {} if exact else await _estimated_counts(db)
+
+    # One round-trip per table plus one for both checkpoints. These share the
+    # request's session, which can't run statements concurrently, so they are
+    # awaited in turn rather than gathered.
+    checkpoints_result = await db.execute(
+        select(SyncCheckpoint.source, SyncCheckpoint.last_sync_at).where(
+            SyncCheckpoint.source.in_(["dispatch_calls", "incident_reports"])
+        )
     )
-    dispatch_oldest = dispatch_oldest_result.scalar()
+    last_syncs = {row.source: row.last_sync_at for row in checkpoints_result}
 
-    dispatch_newest_result = await db.execute(
-        select(func.max(DispatchCall.received_at))
+    dispatch_stats = await db.execute(
+        select(
+            func.count(DispatchCall.id) if exact else null(),
+            func.min(DispatchCall.received_at),
+            func.max(DispatchCall.received_at),
+        )
     )
-    dispatch_newest = dispatch_newest_result.scalar()
+    dispatch_count, dispatch_oldest, dispatch_newest = dispatch_stats.one()
+    if not exact:
+        dispatch_count = estimates.get("dispatch_calls", 0)
 
     dispatch_status = DataSourceStatus(
-        last_sync=dispatch_cp.last_sync_at if dispatch_cp else None,
-        record_count=dispatch_count,
+        last_sync=last_syncs.get("dispatch_calls"),
+        record_count=dispatch_count or 0,
         oldest_record=dispatch_oldest,
         newest_record=dispatch_newest,
     )
 
-    # Get incident reports status
-    incidents_checkpoint = await db.execute(
-        select(SyncCheckpoint).where(SyncCheckpoint.source == "incident_reports")
-    )
-    incidents_cp = incidents_checkpoint.scalar_one_or_none()
-
-    incidents_count_result = await db.execute(select(func.count(IncidentReport.id)))
-    incidents_count = incidents_count_result.scalar() or 0
-
-    incidents_oldest_result = await db.execute(
-        select(func.min(IncidentReport.incident_date))
-    )
-    incidents_oldest = incidents_oldest_result.scalar()
-
-    incidents_newest_result = await db.execute(
-        select(func.max(IncidentReport.incident_date))
+    incidents_stats = await db.execute(
+        select(
+            func.count(IncidentReport.id) if exact else null(),
+            func.min(IncidentReport.incident_date),
+            func.max(IncidentReport.incident_date),
+        )
     )
-    incidents_newest = incidents_newest_result.scalar()
+    incidents_count, incidents_oldest, incidents_newest = incidents_stats.one()
+    if not exact:
+        incidents_count = estimates.get("incident_reports", 0)
 
     date_range = None
     if incidents_oldest and incidents_newest:
         date_range = [str(incidents_oldest), str(incidents_newest)]
 
     incidents_status = DataSourceStatus(
-        last_sync=incidents_cp.last_sync_at if incidents_cp else None,
-        record_count=incidents_count,
+        last_sync=last_syncs.get("incident_reports"),
+        record_count=incidents_count or 0,
         date_range=date_range,
     )
 
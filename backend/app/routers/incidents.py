@@ -1,40 +1,117 @@
 """API routes for historical incident reports."""
 
-import base64
 import logging
+import re
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import select
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import TextClause, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import (
+    INCIDENT_LOOKUP_TTL,
+    etag_response,
+    get_last_modified,
+    incident_lookup_cache,
+    make_etag,
+    not_modified_response,
+    set_cache_headers,
+    set_last_modified,
+)
 from app.database import get_db
-from app.models import IncidentReport
+from app.pagination import decode_cursor, encode_cursor
 from app.schemas.dispatch_call import Coordinates
 from app.schemas.incident_report import IncidentReportOut, IncidentReportsResponse
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/incidents", tags=["incidents"])
 
+# Raw SQL for Neon PostgreSQL compatibility. Statements are built once so the
+# SQL string stays identical across requests and asyncpg's prepared statement
+# cache can reuse the server-side plan.
+_INCIDENT_COLUMNS = """
+            id, incident_id, incident_number,
+            incident_category, incident_subcategory, incident_description,
+            resolution, incident_date, incident_time, report_datetime,
+            lat, lng,
+            location_text, police_district, analysis_neighborhood
+"""
+
+_GET_INCIDENT_SQL = text(f"""
+        SELECT{_INCIDENT_COLUMNS}
+        FROM incident_reports
+        WHERE incident_id = :incident_id
+""")
+
+
+def _distinct_values_sql(column: str) -> TextClause:
+    """
+    Loose index scan: walk a column's btree one distinct value at a time.
+
+    Each step is a min() above the previous value, which Postgres answers with
+    a single index descent, so the cost scales with the number of distinct
+    values rather than the number of rows.
+    """
+    return text(f"""
+        WITH RECURSIVE t(value) AS (
+            SELECT min({column}) FROM incident_reports
+            UNION ALL
+            SELECT (SELECT min({column}) FROM incident_reports WHERE {column} > t.value)
+            FROM t
+            WHERE t.value IS NOT NULL
+        )
+        SELECT value FROM t WHERE value IS NOT NULL
+""")
+
+
+# Both columns have btree indexes (see IncidentReport)
+_DISTINCT_VALUES_SQL = {
+    "incident_category": _distinct_values_sql("incident_category"),
+    "police_district": _distinct_values_sql("police_district"),
+}
 
-def _encode_cursor(report_datetime: datetime, id: int) -> str:
-    """Encode cursor for keyset pagination."""
-    cursor_str = f"{report_datetime.isoformat()}|{id}"
-    return base64.urlsafe_b64encode(cursor_str.encode()).decode()
+# One statement per combination of active search filters (at most 2^6)
+_SEARCH_SQL_CACHE: dict[str, TextClause] = {}
 
+# Words usable as to_tsquery operands; everything else is tsquery syntax
+_SEARCH_WORD_RE = re.compile(r"[^\W_]+")
+_NEGATED_TERM_RE = re.compile(r"(?:^|\s)-")
 
-def _decode_cursor(cursor: str) -> tuple[datetime, int]:
-    """Decode cursor for keyset pagination."""
-    cursor_str = base64.urlsafe_b64decode(cursor.encode()).decode()
-    parts = cursor_str.split("|")
-    report_datetime = datetime.fromisoformat(parts[0])
-    id = int(parts[1])
-    return report_datetime, id
+
+def _prefix_tsquery(q: str) -> str | None:
+    """Build a to_tsquery string matching q with the last word as a prefix.
+
+    Lets a partially typed term ("burg") match the words it starts
+    ("burglary"), which websearch_to_tsquery alone never does. Returns None
+    for queries with a negated term, which the prefix form would turn into
+    a positive match.
+    """
+    words = _SEARCH_WORD_RE.findall(q)
+    if not words or _NEGATED_TERM_RE.search(q):
+        return None
+    return " & ".join(words) + ":*"
+
+
+def _search_sql(where_sql: str) -> TextClause:
+    """Get the search statement for a WHERE clause, building it on first use."""
+    sql = _SEARCH_SQL_CACHE.get(where_sql)
+    if sql is None:
+        sql = text(f"""
+        SELECT{_INCIDENT_COLUMNS}
+        FROM incident_reports
+        WHERE {where_sql}
+        ORDER BY report_datetime DESC NULLS LAST, id DESC
+        LIMIT :limit
+""")
+        _SEARCH_SQL_CACHE[where_sql] = sql
+    return sql
 
 
 @router.get("/search", response_model=IncidentReportsResponse)
 async def search_incidents(
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
     cursor: str | None = None,
     limit: int = Query(50, ge=1, le=200),
@@ -43,14 +120,17 @@ async def search_incidents(
     until: datetime | None = Query(None, description="Only incidents before this date"),
     district: str | None = Query(None, description="Filter by police district"),
     category: str | None = Query(None, description="Filter by incident category"),
-) -> IncidentReportsResponse:
+) -> Response:
     """
     Search historical incident reports with cursor pagination.
 
     Supports filtering by date range, district, and category.
     Uses cursor-based pagination for efficient traversal of large datasets.
+    Pollers can send If-Modified-Since to get 304 until the next sync lands.
     """
-    from sqlalchemy import text
+    last_modified = await get_last_modified(db, "incident_reports")
+    if (not_modified := not_modified_response(request, last_modified)) is not None:
+        return not_modified
 
     # Build dynamic WHERE clauses
     where_clauses = ["1=1"]  # Always true base
@@ -59,10 +139,9 @@ async def search_incidents(
     # Apply cursor filter
     if cursor:
         try:
-            cursor_time, cursor_id = _decode_cursor(cursor)
-            where_clauses.append(
-                "(report_datetime < :cursor_time OR (report_datetime = :cursor_time AND id < :cursor_id))"
-            )
+            cursor_time, cursor_id = decode_cursor(cursor)
+            # Row-value comparison is a single range condition on idx_reports_cursor
+            where_clauses.append("(report_datetime, id) < (:cursor_time, :cursor_id)")
             params["cursor_time"] = cursor_time
             params["cursor_id"] = cursor_id
         except Exception:
@@ -71,14 +150,17 @@ async def search_incidents(
     # Apply search filter
     q_stripped = q.strip() if q else None
     if q_stripped:
-        where_clauses.append("""(
-            incident_category ILIKE :search_term OR
-            incident_subcategory ILIKE :search_term OR
-            incident_description ILIKE :search_term OR
-            location_text ILIKE :search_term OR
-            analysis_neighborhood ILIKE :search_term
-        )""")
-        params["search_term"] = f"%{q_stripped}%"
+        # Served by the GIN index on the generated search_tsv column
+        prefix_query = _prefix_tsquery(q_stripped)
+        if prefix_query:
+            where_clauses.append(
+                "search_tsv @@ (websearch_to_tsquery('english', :search_term)"
+                " || to_tsquery('english', :prefix_query))"
+            )
+            params["prefix_query"] = prefix_query
+        else:
+            where_clauses.append("search_tsv @@ websearch_to_tsquery('english', :search_term)")
+        params["search_term"] = q_stripped
 
     if since:
         where_clauses.append("report_datetime >= :since")
@@ -95,22 +177,7 @@ async def search_incidents(
 
     where_sql = " AND ".join(where_clauses)
 
-    # Use raw SQL for Neon PostgreSQL compatibility
-    sql = text(f"""
-        SELECT
-            id, incident_id, incident_number,
-            incident_category, incident_subcategory, incident_description,
-            resolution, incident_date, incident_time, report_datetime,
-            ST_Y(location::geometry) as lat,
-            ST_X(location::geometry) as lng,
-            location_text, police_district, analysis_neighborhood
-        FROM incident_reports
-        WHERE {where_sql}
-        ORDER BY report_datetime DESC NULLS LAST, id DESC
-        LIMIT :limit
-    """)
-
-    result = await db.execute(sql, params)
+    result = await db.execute(_search_sql(where_sql), params)
     rows = result.fetchall()
 
     # Determine if there's a next page
@@ -118,20 +185,20 @@ async def search_incidents(
     if has_next:
         rows = rows[:limit]
 
-    # Build response
+    # Build response (values come from typed columns, so skip re-validation)
     incidents = []
     for row in rows:
         lat = row[10]
         lng = row[11]
 
         coords = (
-            Coordinates(latitude=float(lat), longitude=float(lng))
+            Coordinates.model_construct(latitude=float(lat), longitude=float(lng))
             if lat is not None and lng is not None
             else None
         )
 
         incidents.append(
-            IncidentReportOut(
+            IncidentReportOut.model_construct(
                 id=row[0],
                 incident_id=row[1],
                 incident_number=row[2],
@@ -156,44 +223,53 @@ async def search_incidents(
         last_report_datetime = last_row[9]
         last_id = last_row[0]
         if last_report_datetime:
-            next_cursor = _encode_cursor(last_report_datetime, last_id)
+            next_cursor = encode_cursor(last_report_datetime, last_id)
 
-    return IncidentReportsResponse(
+    # Serialized by pydantic-core in one pass, skipping FastAPI's model -> dict
+    # -> JSON round trip; response_model still documents the shape.
+    payload = IncidentReportsResponse.model_construct(
         incidents=incidents,
         next_cursor=next_cursor,
     )
+    response = Response(content=payload.model_dump_json(), media_type="application/json")
+    set_cache_headers(response)
+    set_last_modified(response, last_modified)
+    return response
+
+
+async def _distinct_values_response(
+    request: Request,
+    db: AsyncSession,
+    column: str,
+) -> Response:
+    """Sorted distinct non-null values of a column, cached and served with an ETag."""
+    cached = incident_lookup_cache.get(column)
+    if cached is None:
+        result = await db.execute(_DISTINCT_VALUES_SQL[column])
+        content = orjson.dumps(result.scalars().all())
+        cached = (content, make_etag(content))
+        incident_lookup_cache.set(column, cached)
+
+    content, etag = cached
+    return etag_response(request, content, etag, max_age=INCIDENT_LOOKUP_TTL)
 
 
 @router.get("/categories", response_model=list[str])
 async def list_categories(
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[str]:
+) -> Response:
     """Get list of all incident categories."""
-    query = (
-        select(IncidentReport.incident_category)
-        .where(IncidentReport.incident_category.isnot(None))
-        .distinct()
-        .order_by(IncidentReport.incident_category)
-    )
-    result = await db.execute(query)
-    categories = [row[0] for row in result.all()]
-    return categories
+    return await _distinct_values_response(request, db, "incident_category")
 
 
 @router.get("/districts", response_model=list[str])
 async def list_districts(
+    request: Request,
     db: Annotated[AsyncSession, Depends(get_db)],
-) -> list[str]:
+) -> Response:
     """Get list of all police districts."""
-    query = (
-        select(IncidentReport.police_district)
-        .where(IncidentReport.police_district.isnot(None))
-        .distinct()
-        .order_by(IncidentReport.police_district)
-    )
-    result = await db.execute(query)
-    districts = [row[0] for row in result.all()]
-    return districts
+    return await _distinct_values_response(request, db, "police_district")
 
 
 @router.get("/{incident_id}", response_model=IncidentReportOut)
@@ -202,21 +278,7 @@ async def get_incident(
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> IncidentReportOut:
     """Get a specific incident report by ID."""
-    from sqlalchemy import text
-
-    sql = text("""
-        SELECT
-            id, incident_id, incident_number,
-            incident_category, incident_subcategory, incident_description,
-            resolution, incident_date, incident_time, report_datetime,
-            ST_Y(location::geometry) as lat,
-            ST_X(location::geometry) as lng,
-            location_text, police_district, analysis_neighborhood
-        FROM incident_reports
-        WHERE incident_id = :incident_id
-    """)
-
-    result = await db.execute(sql, {"incident_id": incident_id})
+    result = await db.execute(_GET_INCIDENT_SQL, {"incident_id": incident_id})
     row = result.fetchone()
 
     if not row:
@@ -226,12 +288,12 @@ async def get_incident(
     lng = row[11]
 
     coords = (
-        Coordinates(latitude=float(lat), longitude=float(lng))
+        Coordinates.model_construct(latitude=float(lat), longitude=float(lng))
         if lat is not None and lng is not None
         else None
     )
 
-    return IncidentReportOut(
+    return IncidentReportOut.model_construct(
         id=row[0],
         incident_id=row[1],
         incident_number=row[2],
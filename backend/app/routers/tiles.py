@@ -0,0 +1,62 @@
+"""API routes for Mapbox Vector Tiles (MVT) of map layers."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Response
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cache import TTLCache, set_cache_headers
+from app.config import get_settings
+from app.database import get_db
+
+router = APIRouter(prefix="/tiles", tags=["tiles"])
+settings = get_settings()
+
+_tile_cache = TTLCache(ttl=settings.response_cache_seconds)
+
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+
+# Geometries are stored in 4326 while tile envelopes are in 3857, so the
+# envelope is transformed for the GiST-indexed && filter and each point is
+# transformed for tile encoding.
+_CALLS_TILE_SQL = text("""
+    WITH bounds AS (
+        SELECT ST_TileEnvelope(:z, :x, :y) AS geom
+    )
+    SELECT ST_AsMVT(t, 'calls', 4096, 'geom')
+    FROM (
+        SELECT
+            c.id, c.cad_number, c.priority, c.call_type_description,
+            ST_AsMVTGeom(ST_Transform(c.location, 3857), bounds.geom, 4096, 64, true) AS geom
+        FROM dispatch_calls c, bounds
+        WHERE c.location && ST_Transform(bounds.geom, 4326)
+    ) t
+""")
+
+
+@router.get("/calls/{z}/{x}/{y}.mvt")
+async def calls_tile(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    z: int = Path(..., ge=0, le=22),
+    x: int = Path(..., ge=0),
+    y: int = Path(..., ge=0),
+) -> Response:
+    """
+    Get dispatch calls as a vector tile for the given z/x/y tile.
+
+    Encoded server-side with ST_AsMVT, which is several times smaller than the
+    equivalent JSON point list.
+    """
+    if x >= 1 << z or y >= 1 << z:
+        raise HTTPException(status_code=400, detail="Tile coordinates out of range")
+
+    tile = _tile_cache.get((z, x, y))
+    if tile is None:
+        result = await db.execute(_CALLS_TILE_SQL, {"z": z, "x": x, "y": y})
+        tile = bytes(result.scalar() or b"")
+        _tile_cache.set((z, x, y), tile)
+
+    response = Response(content=tile, media_type=MVT_MEDIA_TYPE)
+    set_cache_headers(response)
+    return response
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class Coordinates(BaseModel):
@@ -34,6 +34,11 @@ class DispatchCallOut(BaseModel):
     disposition: str | None = None
 
 
+# Serializer for bare call lists (GET /calls/bbox), built once at import time
+# rather than on a request path.
+dump_calls_json = TypeAdapter(list[DispatchCallOut]).dump_json
+
+
 class DispatchCallsResponse(BaseModel):
     """Paginated response for dispatch calls."""
 
@@ -17,14 +17,15 @@ Architecture:
 - Tracks import sessions for provenance
 """
 
-import json
 import logging
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from typing import AsyncGenerator
 from uuid import UUID, uuid4
 
 import asyncpg
+import orjson
 from asyncpg.types import Range
 
 from app.config import get_settings
@@ -33,18 +34,111 @@ from app.services.diachron_adapter import DiachronFact
 
 def fact_to_daterange(fact: DiachronFact) -> Range:
     """Convert a DiachronFact's temporal data to asyncpg Range for DATERANGE column."""
-    start = fact.valid_from.date()
-    if fact.valid_to:
-        # [) semantics: inclusive start, exclusive end
-        end = fact.valid_to.date() + timedelta(days=1)
-    else:
-        # Point-in-time: single-day range
-        end = start + timedelta(days=1)
-    return Range(start, end, lower_inc=True, upper_inc=False)
+    return fact.to_daterange()
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Half-width of the bounding box searched for duplicate locations. 10m is about
+# 0.00009 degrees of latitude and 0.00012 of longitude at SF's latitude, so
+# 0.0002 degrees always contains the 10m radius.
+_DEDUP_BOX_DEGREES = 0.0002
+
+# Location ids remembered across batches, keyed by coordinates rounded to
+# 1e-5 degrees (about 1m). Any two points in one cell are well within the
+# 10m dedup radius, so they may share a location.
+_LOCATION_CACHE_SIZE = 50_000
+
+
+def _location_key(lng: float, lat: float) -> tuple[int, int]:
+    """Location cache key for a point."""
+    return round(lng * 100_000), round(lat * 100_000)
+
+_INSERT_FACT_SQL = """
+    INSERT INTO location_facts (
+        id, location_id, kind_id, title, description,
+        valid_during, time_granularity, time_certainty, date_display,
+        categories, tags, significance, sources, source_dataset,
+        external_id, created_at
+    ) VALUES (
+        $1, $2, $3, $4, $5,
+        $6, $7::time_granularity, $8::time_certainty, $9,
+        $10, $11, $12::significance_level, $13, $14,
+        $15, $16
+    )
+"""
+
+# location_facts columns in _insert_args order, for COPY
+_FACT_COLUMNS = (
+    "id", "location_id", "kind_id", "title", "description",
+    "valid_during", "time_granularity", "time_certainty", "date_display",
+    "categories", "tags", "significance", "sources", "source_dataset",
+    "external_id", "created_at",
+)
+
+_UPDATE_FACT_SQL = """
+    UPDATE location_facts SET
+        title = $2,
+        description = $3,
+        valid_during = $4,
+        date_display = $5,
+        categories = $6,
+        tags = $7,
+        sources = $8,
+        updated_at = $9
+    WHERE id = $1
+"""
+
+
+def _encode_sources(sources: list[dict]) -> str:
+    """JSON text for the JSONB sources column (asyncpg binds jsonb as str)."""
+    return orjson.dumps(sources).decode()
+
+
+def _insert_args(
+    fact: DiachronFact,
+    location_id: UUID,
+    kind_id: UUID,
+    created_at: datetime,
+    sources_json: str,
+) -> tuple:
+    """Bind arguments for _INSERT_FACT_SQL, also the COPY row for _FACT_COLUMNS."""
+    return (
+        fact.id,
+        location_id,
+        kind_id,
+        fact.title,
+        fact.description,
+        fact_to_daterange(fact),
+        fact.time_granularity,
+        fact.time_certainty,
+        fact.date_display,
+        fact.categories,
+        fact.tags,
+        fact.significance,
+        sources_json,  # JSONB stored as text
+        fact.source_dataset,
+        fact.external_id,
+        created_at,
+    )
+
+
+def _update_args(
+    fact_id: UUID, fact: DiachronFact, updated_at: datetime, sources_json: str
+) -> tuple:
+    """Bind arguments for _UPDATE_FACT_SQL."""
+    return (
+        fact_id,
+        fact.title,
+        fact.description,
+        fact_to_daterange(fact),
+        fact.date_display,
+        fact.categories,
+        fact.tags,
+        sources_json,
+        updated_at,
+    )
+
 
 class DiachronWriter:
     """
@@ -64,6 +158,8 @@ class DiachronWriter:
         self.database_url = database_url or settings.diachron_database_url
         self._pool: asyncpg.Pool | None = None
         self._fact_kinds_cache: dict[str, UUID] = {}
+        self._neighborhoods_cache: dict[str, UUID] = {}
+        self._location_cache: OrderedDict[tuple[int, int], UUID] = OrderedDict()
 
     async def connect(self) -> None:
         """Create connection pool to Diachron database."""
@@ -77,20 +173,23 @@ class DiachronWriter:
 
         self._pool = await asyncpg.create_pool(
             db_url,
-            min_size=2,
-            max_size=10,
-            command_timeout=30,
+            min_size=settings.diachron_pool_min_size,
+            max_size=settings.diachron_pool_max_size,
+            max_inactive_connection_lifetime=settings.diachron_pool_max_idle,
+            command_timeout=settings.diachron_command_timeout,
         )
         logger.info("Connected to Diachron database")
 
-        # Preload fact_kinds cache
+        # Preload fact_kinds and neighborhoods caches
         await self._load_fact_kinds()
+        await self._load_neighborhoods()
 
     async def disconnect(self) -> None:
         """Close connection pool."""
         if self._pool:
             await self._pool.close()
             self._pool = None
+            self._location_cache.clear()
             logger.info("Disconnected from Diachron database")
 
     @asynccontextmanager
@@ -115,6 +214,19 @@ class DiachronWriter:
             await self._load_fact_kinds()
         return self._fact_kinds_cache.get(code)
 
+    async def _load_neighborhoods(self) -> None:
+        """Load neighborhood slugs into cache; the table is small and rarely changes."""
+        async with self.connection() as conn:
+            rows = await conn.fetch("SELECT id, slug FROM neighborhoods")
+            self._neighborhoods_cache = {row["slug"]: row["id"] for row in rows}
+            logger.info(f"Loaded {len(self._neighborhoods_cache)} neighborhoods")
+
+    async def _get_neighborhood_id(self, slug: str) -> UUID | None:
+        """Get neighborhood UUID by slug."""
+        if not self._neighborhoods_cache:
+            await self._load_neighborhoods()
+        return self._neighborhoods_cache.get(slug)
+
     async def _find_or_create_location(
         self,
         conn: asyncpg.Connection,
@@ -128,11 +240,15 @@ class DiachronWriter:
 
         Uses ST_DWithin with 10m threshold for deduplication.
         """
-        # Try to find existing location within 10 meters
+        # Try to find existing location within 10 meters. Casting the column to
+        # geography hides it from its geometry GiST index, so first narrow the
+        # candidates with an indexable bounding-box test in degrees, then apply
+        # the exact geography distance to those few rows only.
         row = await conn.fetchrow(
             """
             SELECT id FROM locations
-            WHERE ST_DWithin(
+            WHERE coordinates && ST_Expand(ST_SetSRID(ST_MakePoint($1, $2), 4326), $3)
+              AND ST_DWithin(
                 coordinates::geography,
                 ST_SetSRID(ST_MakePoint($1, $2), 4326)::geography,
                 10  -- 10 meters threshold
@@ -141,6 +257,7 @@ class DiachronWriter:
             """,
             lng,
             lat,
+            _DEDUP_BOX_DEGREES,
         )
 
         if row:
@@ -149,12 +266,7 @@ class DiachronWriter:
         # Look up neighborhood_id if slug provided
         neighborhood_id = None
         if neighborhood_slug:
-            nbhd_row = await conn.fetchrow(
-                "SELECT id FROM neighborhoods WHERE slug = $1",
-                neighborhood_slug,
-            )
-            if nbhd_row:
-                neighborhood_id = nbhd_row["id"]
+            neighborhood_id = await self._get_neighborhood_id(neighborhood_slug)
 
         # Create new location
         location_id = uuid4()
@@ -172,6 +284,81 @@ class DiachronWriter:
 
         return location_id
 
+    async def _resolve_locations(
+        self, conn: asyncpg.Connection, facts: list[DiachronFact]
+    ) -> list[UUID]:
+        """
+        Location id for each fact, creating locations that do not exist yet.
+
+        Points seen in earlier batches come from the location cache. Existing
+        locations for the remaining distinct points are found with one query.
+        Only points with no match go through _find_or_create_location, one at
+        a time, so a new location still absorbs later points within 10m.
+        """
+        if not facts:
+            return []
+
+        keys = [_location_key(f.coordinates_lng, f.coordinates_lat) for f in facts]
+        found: dict[tuple[int, int], UUID] = {}
+        points: dict[tuple[int, int], tuple[float, float]] = {}
+        for key, fact in zip(keys, facts, strict=True):
+            if key in found or key in points:
+                continue
+            if (cached := self._location_cache.get(key)) is not None:
+                self._location_cache.move_to_end(key)
+                found[key] = cached
+            else:
+                points[key] = (fact.coordinates_lng, fact.coordinates_lat)
+
+        if points:
+            rows = await conn.fetch(
+                """
+                SELECT (
+                    SELECT l.id FROM locations l
+                    WHERE l.coordinates
+                          && ST_Expand(ST_SetSRID(ST_MakePoint(p.lng, p.lat), 4326), $3)
+                      AND ST_DWithin(
+                        l.coordinates::geography,
+                        ST_SetSRID(ST_MakePoint(p.lng, p.lat), 4326)::geography,
+                        10  -- 10 meters threshold
+                    )
+                    LIMIT 1
+                ) AS id
+                FROM unnest($1::float8[], $2::float8[]) WITH ORDINALITY AS p(lng, lat, idx)
+                ORDER BY p.idx
+                """,
+                [lng for lng, _ in points.values()],
+                [lat for _, lat in points.values()],
+                _DEDUP_BOX_DEGREES,
+            )
+            for key, row in zip(points, rows, strict=True):
+                if row["id"]:
+                    found[key] = row["id"]
+
+        location_ids = []
+        for key, fact in zip(keys, facts, strict=True):
+            location_id = found.get(key)
+            if location_id is None:
+                location_id = found[key] = await self._find_or_create_location(
+                    conn,
+                    lat=fact.coordinates_lat,
+                    lng=fact.coordinates_lng,
+                    address=fact.address,
+                    neighborhood_slug=fact.neighborhood_slug,
+                )
+            location_ids.append(location_id)
+        return location_ids
+
+    def _remember_locations(self, facts: list[DiachronFact], location_ids: list[UUID]) -> None:
+        """Cache committed location ids for later batches, evicting the oldest."""
+        cache = self._location_cache
+        for fact, location_id in zip(facts, location_ids, strict=True):
+            key = _location_key(fact.coordinates_lng, fact.coordinates_lat)
+            cache[key] = location_id
+            cache.move_to_end(key)
+        while len(cache) > _LOCATION_CACHE_SIZE:
+            cache.popitem(last=False)
+
     async def write_fact(self, fact: DiachronFact) -> UUID | None:
         """
         Write a single fact to Diachron's location_facts table.
@@ -210,42 +397,14 @@ class DiachronWriter:
                     return existing["id"]
 
             # Insert new fact
-            fact_id = fact.id
-            daterange = fact_to_daterange(fact)
-
             await conn.execute(
-                """
-                INSERT INTO location_facts (
-                    id, location_id, kind_id, title, description,
-                    valid_during, time_granularity, time_certainty, date_display,
-                    categories, tags, significance, sources, source_dataset,
-                    external_id, created_at
-                ) VALUES (
-                    $1, $2, $3, $4, $5,
-                    $6, $7::time_granularity, $8::time_certainty, $9,
-                    $10, $11, $12::significance_level, $13, $14,
-                    $15, $16
-                )
-                """,
-                fact_id,
-                location_id,
-                kind_id,
-                fact.title,
-                fact.description,
-                daterange,
-                fact.time_granularity,
-                fact.time_certainty,
-                fact.date_display,
-                fact.categories,
-                fact.tags,
-                fact.significance,
-                json.dumps(fact.sources),  # JSONB stored as text
-                fact.source_dataset,
-                fact.external_id,
-                datetime.now(UTC),
+                _INSERT_FACT_SQL,
+                *_insert_args(
+                    fact, location_id, kind_id, datetime.now(UTC), _encode_sources(fact.sources)
+                ),
             )
 
-            return fact_id
+            return fact.id
 
     async def _update_fact(
         self,
@@ -255,30 +414,9 @@ class DiachronWriter:
         kind_id: UUID,
     ) -> None:
         """Update an existing fact with new data."""
-        daterange = fact_to_daterange(fact)
-
         await conn.execute(
-            """
-            UPDATE location_facts SET
-                title = $2,
-                description = $3,
-                valid_during = $4,
-                date_display = $5,
-                categories = $6,
-                tags = $7,
-                sources = $8,
-                updated_at = $9
-            WHERE id = $1
-            """,
-            fact_id,
-            fact.title,
-            fact.description,
-            daterange,
-            fact.date_display,
-            fact.categories,
-            fact.tags,
-            json.dumps(fact.sources),
-            datetime.now(UTC),
+            _UPDATE_FACT_SQL,
+            *_update_args(fact_id, fact, datetime.now(UTC), _encode_sources(fact.sources)),
         )
 
     async def write_facts_batch(
@@ -289,7 +427,9 @@ class DiachronWriter:
         """
         Write multiple facts in a batch.
 
-        Uses a single transaction for efficiency.
+        Uses a single transaction for efficiency. Existing locations and facts
+        are each looked up with one query for the whole batch, new facts are
+        loaded with a binary COPY and updates sent with executemany.
 
         Args:
             facts: List of DiachronFact instances
@@ -301,78 +441,75 @@ class DiachronWriter:
         if not facts:
             return 0, 0
 
-        inserted = 0
-        updated = 0
+        if not self._fact_kinds_cache:
+            await self._load_fact_kinds()
+
+        now = datetime.now(UTC)
+        # Adapters share one sources list per dataset, so a batch usually
+        # encodes a single payload. Keyed by id(); the facts keep them alive.
+        sources_json: dict[int, str] = {}
+        insert_rows: list[tuple] = []
+        update_rows: list[tuple] = []
 
         async with self.connection() as conn:
             async with conn.transaction():
+                kinds: list[tuple[DiachronFact, UUID]] = []
                 for fact in facts:
-                    kind_id = await self._get_fact_kind_id(fact.kind_code)
+                    kind_id = self._fact_kinds_cache.get(fact.kind_code)
                     if not kind_id:
                         logger.warning(f"Skipping unknown fact_kind: {fact.kind_code}")
                         continue
-
-                    # Find or create location
-                    location_id = await self._find_or_create_location(
-                        conn,
-                        lat=fact.coordinates_lat,
-                        lng=fact.coordinates_lng,
-                        address=fact.address,
-                        neighborhood_slug=fact.neighborhood_slug,
+                    kinds.append((fact, kind_id))
+
+                # Existing facts for every (external_id, kind) in the batch
+                keyed = [(fact.external_id, kind_id) for fact, kind_id in kinds if fact.external_id]
+                existing: dict[tuple[str, UUID], UUID] = {}
+                if keyed:
+                    external_ids, kind_ids = zip(*keyed, strict=True)
+                    rows = await conn.fetch(
+                        """
+                        SELECT lf.id, lf.external_id, lf.kind_id
+                        FROM location_facts lf
+                        JOIN unnest($1::text[], $2::uuid[]) AS k(external_id, kind_id)
+                          ON lf.external_id = k.external_id AND lf.kind_id = k.kind_id
+                        """,
+                        list(external_ids),
+                        list(kind_ids),
                     )
+                    for row in rows:
+                        existing.setdefault((row["external_id"], row["kind_id"]), row["id"])
 
-                    # Check for existing
-                    existing = None
-                    if fact.external_id:
-                        existing = await conn.fetchrow(
-                            """
-                            SELECT id FROM location_facts
-                            WHERE external_id = $1 AND kind_id = $2
-                            """,
-                            fact.external_id,
-                            kind_id,
-                        )
+                located = [fact for fact, _ in kinds]
+                location_ids = await self._resolve_locations(conn, located)
 
-                    if existing:
-                        await self._update_fact(conn, existing["id"], fact, kind_id)
-                        updated += 1
+                for (fact, kind_id), location_id in zip(kinds, location_ids, strict=True):
+                    encoded = sources_json.get(id(fact.sources))
+                    if encoded is None:
+                        encoded = sources_json[id(fact.sources)] = _encode_sources(fact.sources)
+
+                    key = (fact.external_id, kind_id)
+                    if fact.external_id and key in existing:
+                        update_rows.append(_update_args(existing[key], fact, now, encoded))
                     else:
-                        # Insert new
-                        daterange = fact_to_daterange(fact)
-
-                        await conn.execute(
-                            """
-                            INSERT INTO location_facts (
-                                id, location_id, kind_id, title, description,
-                                valid_during, time_granularity, time_certainty,
-                                date_display, categories, tags, significance,
-                                sources, source_dataset, external_id, created_at
-                            ) VALUES (
-                                $1, $2, $3, $4, $5,
-                                $6, $7::time_granularity, $8::time_certainty,
-                                $9, $10, $11, $12::significance_level,
-                                $13, $14, $15, $16
-                            )
-                            """,
-                            fact.id,
-                            location_id,
-                            kind_id,
-                            fact.title,
-                            fact.description,
-                            daterange,
-                            fact.time_granularity,
-                            fact.time_certainty,
-                            fact.date_display,
-                            fact.categories,
-                            fact.tags,
-                            fact.significance,
-                            json.dumps(fact.sources),
-                            fact.source_dataset,
-                            fact.external_id,
-                            datetime.now(UTC),
+                        insert_rows.append(
+                            _insert_args(fact, location_id, kind_id, now, encoded)
                         )
-                        inserted += 1
+                        if fact.external_id:
+                            # A repeat later in this batch updates this row
+                            existing[key] = fact.id
+
+                if insert_rows:
+                    # Binary COPY: one round trip, no per-row statement execution
+                    await conn.copy_records_to_table(
+                        "location_facts", records=insert_rows, columns=_FACT_COLUMNS
+                    )
+                if update_rows:
+                    await conn.executemany(_UPDATE_FACT_SQL, update_rows)
 
+        # Only after commit: a rolled-back batch must not leave ids to locations
+        # that were never created
+        self._remember_locations(located, location_ids)
+        inserted, updated = len(insert_rows), len(update_rows)
         logger.info(
             f"Diachron batch write complete: {inserted} inserted, {updated} updated"
         )
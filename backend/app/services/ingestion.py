@@ -5,15 +5,20 @@
 
 """Ingestion service for syncing DataSF data to local database."""
 
+import asyncio
 import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import UTC, datetime, timedelta
 
 from geoalchemy2 import WKTElement
-from sqlalchemy import delete, func, select, text
+from sqlalchemy import delete, func, select, text, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.cache import incident_lookup_cache, last_modified_cache
 from app.config import get_settings
+from app.database import Base
 from app.models import (
     DispatchCall,
     FireCall,
@@ -24,6 +29,7 @@ from app.models import (
 )
 from app.schemas.dispatch_call import Coordinates, DispatchCallOut
 from app.services.diachron_adapter import (
+    DiachronFact,
     dispatch_call_dict_to_diachron,
     fire_call_dict_to_diachron,
     incident_report_dict_to_diachron,
@@ -36,6 +42,64 @@ from app.services.soda_client import SODAClient
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Raw DataSF record -> Diachron fact converter for each dual-written kind
+_DIACHRON_CONVERTERS = {
+    "dispatch": dispatch_call_dict_to_diachron,
+    "incident": incident_report_dict_to_diachron,
+    "fire": fire_call_dict_to_diachron,
+    "311": service_request_dict_to_diachron,
+    "traffic": traffic_crash_dict_to_diachron,
+}
+
+# Smaller batches (every incremental sync) convert faster in-process than
+# they could be pickled to and from worker processes
+_PARALLEL_CONVERT_MIN_RECORDS = 5000
+
+_convert_pool: ProcessPoolExecutor | None = None
+
+
+def _convert_records(kind: str, records: list[dict]) -> list[DiachronFact]:
+    """Convert raw records to Diachron facts, dropping ones the adapter rejects."""
+    convert = _DIACHRON_CONVERTERS[kind]
+    return [fact for record in records if (fact := convert(record)) is not None]
+
+
+def _get_convert_pool() -> ProcessPoolExecutor:
+    """Process pool for fact conversion, created on first use."""
+    global _convert_pool
+
+    if _convert_pool is None:
+        # spawn, not fork: the app process runs the scheduler and log threads
+        _convert_pool = ProcessPoolExecutor(
+            max_workers=settings.diachron_convert_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _convert_pool
+
+
+def shutdown_convert_pool() -> None:
+    """Stop the conversion worker processes, if any were started."""
+    global _convert_pool
+
+    if _convert_pool is not None:
+        _convert_pool.shutdown(wait=False, cancel_futures=True)
+        _convert_pool = None
+
+
+async def _convert_records_parallel(kind: str, records: list[dict]) -> list[DiachronFact]:
+    """Convert a large batch in one chunk per worker process, keeping record order."""
+    workers = settings.diachron_convert_workers
+    chunk_size = -(-len(records) // workers)
+    pool = _get_convert_pool()
+    loop = asyncio.get_running_loop()
+    chunks = await asyncio.gather(
+        *(
+            loop.run_in_executor(pool, _convert_records, kind, records[i:i + chunk_size])
+            for i in range(0, len(records), chunk_size)
+        )
+    )
+    return [fact for chunk in chunks for fact in chunk]
+
 
 class IngestionService:
     """
@@ -52,23 +116,16 @@ class IngestionService:
         self.soda_client = soda_client or SODAClient()
 
     def _parse_datetime(self, value: str | None) -> datetime | None:
-        """Parse ISO 8601 datetime string."""
+        """Parse ISO 8601 datetime string; naive values are UTC."""
         if not value:
             return None
         try:
-            # Handle various formats
-            for fmt in [
-                "%Y-%m-%dT%H:%M:%S.%f",
-                "%Y-%m-%dT%H:%M:%S",
-                "%Y-%m-%d %H:%M:%S",
-            ]:
-                try:
-                    return datetime.strptime(value, fmt).replace(tzinfo=UTC)
-                except ValueError:
-                    continue
-            return None
-        except Exception:
+            # Since 3.11 this takes "T" or space separators, fractions and a
+            # trailing "Z" directly, in a single C-level parse
+            parsed = datetime.fromisoformat(value)
+        except (ValueError, TypeError):
             return None
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=UTC)
 
     def _parse_point(self, record: dict) -> WKTElement | None:
         """Extract PostGIS point from record coordinates."""
@@ -123,17 +180,43 @@ class IngestionService:
             source=source,
             last_updated_at=last_updated_at,
             last_sync_at=func.now(),
+            last_modified_at=func.now(),
             record_count=record_count,
         ).on_conflict_do_update(
             index_elements=["source"],
             set_={
                 "last_updated_at": last_updated_at,
                 "last_sync_at": func.now(),
+                "last_modified_at": func.now(),
                 "record_count": record_count,
             },
         )
         await self.db.execute(stmt)
         await self.db.commit()
+        last_modified_cache.clear()
+
+    async def _bulk_upsert(self, model: type[Base], rows: list[dict], key: str) -> None:
+        """
+        Upsert rows with a single multi-row INSERT ... ON CONFLICT DO UPDATE.
+
+        Rows sharing a conflict key are collapsed to the last one, since Postgres
+        rejects a statement that would update the same row twice.
+
+        Args:
+            model: Model class to insert into
+            rows: Column values per row (all rows must have the same keys)
+            key: Unique column used as the conflict target
+        """
+        if not rows:
+            return
+
+        unique_rows = list({row[key]: row for row in rows}.values())
+        stmt = insert(model).values(unique_rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[key],
+            set_={column: stmt.excluded[column] for column in unique_rows[0] if column != key},
+        )
+        await self.db.execute(stmt)
 
     async def sync_dispatch_calls(self) -> tuple[int, list[str]]:
         """
@@ -148,6 +231,14 @@ class IngestionService:
         checkpoint = await self.get_checkpoint("dispatch_calls")
         logger.info(f"Last dispatch checkpoint: {checkpoint}")
 
+        # dispatch_calls is UNLOGGED and comes back empty after a crash or
+        # compute restart; refetch the whole window instead of resuming.
+        if checkpoint is not None:
+            has_rows = await self.db.execute(select(DispatchCall.id).limit(1))
+            if has_rows.first() is None:
+                logger.info("dispatch_calls is empty; ignoring checkpoint for full resync")
+                checkpoint = None
+
         # Fetch new records
         records = await self.soda_client.fetch_all_dispatch_calls(since=checkpoint)
 
@@ -155,8 +246,8 @@ class IngestionService:
             logger.info("No new dispatch call records")
             return 0, []
 
-        # Transform and upsert
-        upserted = 0
+        # Transform records
+        transformed = []
         upserted_cad_numbers: list[str] = []
         latest_updated = checkpoint
 
@@ -174,7 +265,6 @@ class IngestionService:
             if last_updated and (not latest_updated or last_updated > latest_updated):
                 latest_updated = last_updated
 
-            # Build upsert statement
             values = {
                 "cad_number": cad_number,
                 "call_type_code": record.get("call_type_original"),
@@ -191,15 +281,15 @@ class IngestionService:
                 "last_updated_at": last_updated,
             }
 
-            stmt = insert(DispatchCall).values(**values).on_conflict_do_update(
-                index_elements=["cad_number"],
-                set_={k: v for k, v in values.items() if k != "cad_number"},
-            )
-
-            await self.db.execute(stmt)
-            upserted += 1
+            transformed.append(values)
             upserted_cad_numbers.append(cad_number)
 
+        # Batch upsert for performance (500 at a time)
+        batch_size = 500
+        for i in range(0, len(transformed), batch_size):
+            await self._bulk_upsert(DispatchCall, transformed[i:i + batch_size], "cad_number")
+        upserted = len(transformed)
+
         await self.db.commit()
 
         # Update checkpoint
@@ -233,8 +323,7 @@ class IngestionService:
             SELECT
                 id, cad_number, call_type_code, call_type_description, priority,
                 received_at, dispatch_at, on_scene_at, closed_at,
-                ST_Y(location::geometry) as lat,
-                ST_X(location::geometry) as lng,
+                lat, lng,
                 location_text, district, disposition
             FROM dispatch_calls
             WHERE cad_number IN ({placeholders})
@@ -248,13 +337,13 @@ class IngestionService:
         calls = []
         for row in rows:
             coords = (
-                Coordinates(latitude=float(row.lat), longitude=float(row.lng))
+                Coordinates.model_construct(latitude=float(row.lat), longitude=float(row.lng))
                 if row.lat is not None and row.lng is not None
                 else None
             )
 
             calls.append(
-                DispatchCallOut(
+                DispatchCallOut.model_construct(
                     id=row.id,
                     cad_number=row.cad_number,
                     call_type_code=row.call_type_code,
@@ -368,13 +457,8 @@ class IngestionService:
         for i in range(0, len(transformed), batch_size):
             batch = transformed[i:i + batch_size]
 
-            for values in batch:
-                stmt = insert(IncidentReport).values(**values).on_conflict_do_update(
-                    index_elements=["incident_id"],
-                    set_={k: v for k, v in values.items() if k != "incident_id"},
-                )
-                await self.db.execute(stmt)
-                upserted += 1
+            await self._bulk_upsert(IncidentReport, batch, "incident_id")
+            upserted += len(batch)
 
             # Commit each batch to avoid long transactions
             await self.db.commit()
@@ -387,6 +471,7 @@ class IngestionService:
             await self.update_checkpoint("incident_reports", latest_updated, count or 0)
 
         logger.info(f"Synced {upserted} incident report records")
+        incident_lookup_cache.clear()
 
         # Dual-write to Diachron (if enabled)
         await self._write_to_diachron(records, kind="incident")
@@ -509,13 +594,8 @@ class IngestionService:
         for i in range(0, len(transformed), batch_size):
             batch = transformed[i:i + batch_size]
 
-            for values in batch:
-                stmt = insert(FireCall).values(**values).on_conflict_do_update(
-                    index_elements=["incident_number"],
-                    set_={k: v for k, v in values.items() if k != "incident_number"},
-                )
-                await self.db.execute(stmt)
-                upserted += 1
+            await self._bulk_upsert(FireCall, batch, "incident_number")
+            upserted += len(batch)
 
             # Commit each batch to avoid long transactions
             await self.db.commit()
@@ -638,13 +718,8 @@ class IngestionService:
         for i in range(0, len(transformed), batch_size):
             batch = transformed[i:i + batch_size]
 
-            for values in batch:
-                stmt = insert(ServiceRequest).values(**values).on_conflict_do_update(
-                    index_elements=["service_request_id"],
-                    set_={k: v for k, v in values.items() if k != "service_request_id"},
-                )
-                await self.db.execute(stmt)
-                upserted += 1
+            await self._bulk_upsert(ServiceRequest, batch, "service_request_id")
+            upserted += len(batch)
 
             # Commit each batch to avoid long transactions
             await self.db.commit()
@@ -787,13 +862,8 @@ class IngestionService:
         for i in range(0, len(transformed), batch_size):
             batch = transformed[i:i + batch_size]
 
-            for values in batch:
-                stmt = insert(TrafficCrash).values(**values).on_conflict_do_update(
-                    index_elements=["unique_id"],
-                    set_={k: v for k, v in values.items() if k != "unique_id"},
-                )
-                await self.db.execute(stmt)
-                upserted += 1
+            await self._bulk_upsert(TrafficCrash, batch, "unique_id")
+            upserted += len(batch)
 
             # Commit each batch to avoid long transactions
             await self.db.commit()
@@ -824,10 +894,19 @@ class IngestionService:
         result = await self.db.execute(
             delete(DispatchCall).where(DispatchCall.received_at < cutoff)
         )
+        deleted = result.rowcount
+        if deleted:
+            # Deleting rows changes /calls, so move its Last-Modified too.
+            # last_sync_at is left alone: /health reports it as sync freshness.
+            await self.db.execute(
+                update(SyncCheckpoint)
+                .where(SyncCheckpoint.source == "dispatch_calls")
+                .values(last_modified_at=func.now())
+            )
         await self.db.commit()
 
-        deleted = result.rowcount
         if deleted:
+            last_modified_cache.clear()
             logger.info(f"Pruned {deleted} old dispatch calls")
 
         return deleted
@@ -845,7 +924,7 @@ class IngestionService:
 
         Args:
             records: Raw DataSF records
-            kind: Record type ('dispatch' or 'incident')
+            kind: Record type ('dispatch', 'incident', 'fire', '311' or 'traffic')
 
         Returns:
             Tuple of (inserted_count, updated_count)
@@ -855,25 +934,17 @@ class IngestionService:
             # Diachron integration disabled
             return 0, 0
 
-        # Convert records to Diachron facts
-        facts = []
-        for record in records:
-            if kind == "dispatch":
-                fact = dispatch_call_dict_to_diachron(record)
-            elif kind == "incident":
-                fact = incident_report_dict_to_diachron(record)
-            elif kind == "fire":
-                fact = fire_call_dict_to_diachron(record)
-            elif kind == "311":
-                fact = service_request_dict_to_diachron(record)
-            elif kind == "traffic":
-                fact = traffic_crash_dict_to_diachron(record)
-            else:
-                logger.warning(f"Unknown record kind: {kind}")
-                continue
+        if kind not in _DIACHRON_CONVERTERS:
+            logger.warning(f"Unknown record kind: {kind}")
+            return 0, 0
 
-            if fact:
-                facts.append(fact)
+        if (
+            settings.diachron_convert_workers > 0
+            and len(records) >= _PARALLEL_CONVERT_MIN_RECORDS
+        ):
+            facts = await _convert_records_parallel(kind, records)
+        else:
+            facts = _convert_records(kind, records)
 
         if not facts:
             return 0, 0
@@ -939,16 +1010,12 @@ class IngestionService:
         for i in range(0, len(transformed), batch_size):
             batch = transformed[i:i + batch_size]
 
-            for values in batch:
-                stmt = insert(IncidentReport).values(**values).on_conflict_do_update(
-                    index_elements=["incident_id"],
-                    set_={k: v for k, v in values.items() if k != "incident_id"},
-                )
-                await self.db.execute(stmt)
-                upserted += 1
+            await self._bulk_upsert(IncidentReport, batch, "incident_id")
+            upserted += len(batch)
 
             await self.db.commit()
             logger.info(f"Upserted batch {i // batch_size + 1}: {upserted}/{len(transformed)} records")
 
         logger.info(f"Chunked sync complete: {upserted} incident records")
+        incident_lookup_cache.clear()
         return upserted
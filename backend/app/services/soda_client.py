@@ -6,6 +6,7 @@ from datetime import datetime
 from typing import Any
 
 import httpx
+import orjson
 
 from app.config import get_settings
 
@@ -61,7 +62,9 @@ class SODAClient:
                 async with httpx.AsyncClient(timeout=self.timeout) as client:
                     response = await client.get(url, headers=self.headers, params=params)
                     response.raise_for_status()
-                    return response.json()
+                    # orjson decodes the raw bytes several times faster than
+                    # the stdlib json behind response.json()
+                    return orjson.loads(response.content)
 
             except httpx.HTTPStatusError as e:
                 last_error = e
@@ -0,0 +1,51 @@
+"""Replace single-column priority/district indexes with composite filter indexes.
+
+Revision ID: a1c7d04bef45
+Revises: f8b6c93abd34
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a1c7d04bef45"
+down_revision: str | None = "f8b6c93abd34"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Priority filters are always paired with a received_at DESC sort
+    op.create_index(
+        "idx_calls_filter",
+        "dispatch_calls",
+        ["priority", sa.text("received_at DESC")],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_fire_calls_filter",
+        "fire_calls",
+        ["priority", sa.text("received_at DESC")],
+        if_not_exists=True,
+    )
+
+    op.drop_index("ix_dispatch_calls_priority", table_name="dispatch_calls", if_exists=True)
+    # No query filters on district; the index only slowed the 5-minute upserts
+    op.drop_index("ix_dispatch_calls_district", table_name="dispatch_calls", if_exists=True)
+    op.drop_index("ix_fire_calls_priority", table_name="fire_calls", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index("ix_fire_calls_priority", "fire_calls", ["priority"], if_not_exists=True)
+    op.create_index(
+        "ix_dispatch_calls_district", "dispatch_calls", ["district"], if_not_exists=True
+    )
+    op.create_index(
+        "ix_dispatch_calls_priority", "dispatch_calls", ["priority"], if_not_exists=True
+    )
+
+    op.drop_index("idx_fire_calls_filter", table_name="fire_calls", if_exists=True)
+    op.drop_index("idx_calls_filter", table_name="dispatch_calls", if_exists=True)
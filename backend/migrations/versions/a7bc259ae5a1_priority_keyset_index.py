@@ -0,0 +1,38 @@
+"""Add id to the dispatch call priority filter index for keyset pagination.
+
+Revision ID: a7bc259ae5a1
+Revises: f6ab148fd490
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7bc259ae5a1"
+down_revision: str | None = "f6ab148fd490"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _create_filter_index(*columns: str) -> None:
+    op.create_index(
+        "idx_calls_filter",
+        "dispatch_calls",
+        [sa.text(column) for column in columns],
+        if_not_exists=True,
+    )
+
+
+def upgrade() -> None:
+    # With id as the last key, (received_at, id) < (:t, :i) cursors under a
+    # priority filter stay an ordered index range scan with no sort step
+    op.drop_index("idx_calls_filter", table_name="dispatch_calls", if_exists=True)
+    _create_filter_index("priority", "received_at DESC", "id DESC")
+
+
+def downgrade() -> None:
+    op.drop_index("idx_calls_filter", table_name="dispatch_calls", if_exists=True)
+    _create_filter_index("priority", "received_at DESC")
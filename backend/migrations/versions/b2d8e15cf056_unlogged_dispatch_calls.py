@@ -0,0 +1,25 @@
+"""Make dispatch_calls an UNLOGGED table.
+
+Revision ID: b2d8e15cf056
+Revises: a1c7d04bef45
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b2d8e15cf056"
+down_revision: str | None = "a1c7d04bef45"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # 48-hour rolling data re-fetchable from DataSF: skip WAL for its writes
+    op.execute("ALTER TABLE dispatch_calls SET UNLOGGED")
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE dispatch_calls SET LOGGED")
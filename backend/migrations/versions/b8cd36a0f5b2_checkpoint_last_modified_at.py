@@ -0,0 +1,36 @@
+"""Add last_modified_at to sync_checkpoints for HTTP Last-Modified.
+
+Revision ID: b8cd36a0f5b2
+Revises: a7bc259ae5a1
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8cd36a0f5b2"
+down_revision: str | None = "a7bc259ae5a1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Pruning moves last_modified_at without touching last_sync_at, which
+    # /health reports as sync freshness
+    op.add_column(
+        "sync_checkpoints",
+        sa.Column(
+            "last_modified_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+    )
+    op.execute("UPDATE sync_checkpoints SET last_modified_at = last_sync_at")
+
+
+def downgrade() -> None:
+    op.drop_column("sync_checkpoints", "last_modified_at")
@@ -0,0 +1,38 @@
+"""Add stored generated lat/lng columns to dispatch_calls and incident_reports.
+
+Revision ID: c3e9f26da167
+Revises: b2d8e15cf056
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c3e9f26da167"
+down_revision: str | None = "b2d8e15cf056"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = ["dispatch_calls", "incident_reports"]
+
+
+def upgrade() -> None:
+    # Rewrites each table once to populate the stored values
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column("lat", sa.Double(), sa.Computed("ST_Y(location)", persisted=True)),
+        )
+        op.add_column(
+            table,
+            sa.Column("lng", sa.Double(), sa.Computed("ST_X(location)", persisted=True)),
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_column(table, "lng")
+        op.drop_column(table, "lat")
@@ -0,0 +1,58 @@
+"""Replace GiST location indexes with SP-GiST on dispatch_calls and incident_reports.
+
+Revision ID: d4fa037eb278
+Revises: c3e9f26da167
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4fa037eb278"
+down_revision: str | None = "c3e9f26da167"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, named GiST index, GiST index auto-created by GeoAlchemy2, new SP-GiST index)
+LOCATION_INDEXES = [
+    (
+        "dispatch_calls",
+        "idx_calls_location",
+        "idx_dispatch_calls_location",
+        "idx_calls_location_spgist",
+    ),
+    (
+        "incident_reports",
+        "idx_reports_location",
+        "idx_incident_reports_location",
+        "idx_reports_location_spgist",
+    ),
+]
+
+
+def upgrade() -> None:
+    for table, gist_index, auto_gist_index, spgist_index in LOCATION_INDEXES:
+        op.create_index(
+            spgist_index,
+            table,
+            ["location"],
+            postgresql_using="spgist",
+            if_not_exists=True,
+        )
+        op.drop_index(gist_index, table_name=table, if_exists=True)
+        # Duplicate of gist_index, created by GeoAlchemy2 alongside the table
+        op.drop_index(auto_gist_index, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    for table, gist_index, _auto_gist_index, spgist_index in LOCATION_INDEXES:
+        op.create_index(
+            gist_index,
+            table,
+            ["location"],
+            postgresql_using="gist",
+            if_not_exists=True,
+        )
+        op.drop_index(spgist_index, table_name=table, if_exists=True)
@@ -0,0 +1,51 @@
+"""Add a generated full-text search column and GIN index to incident_reports.
+
+Revision ID: e5ab148fc389
+Revises: d4fa037eb278
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "e5ab148fc389"
+down_revision: str | None = "d4fa037eb278"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Keep in sync with IncidentReport.SEARCH_TSV_EXPRESSION
+SEARCH_TSV_EXPRESSION = (
+    "to_tsvector('english', "
+    "coalesce(incident_category, '') || ' ' || "
+    "coalesce(incident_subcategory, '') || ' ' || "
+    "coalesce(incident_description, '') || ' ' || "
+    "coalesce(location_text, '') || ' ' || "
+    "coalesce(analysis_neighborhood, ''))"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        "incident_reports",
+        sa.Column(
+            "search_tsv",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_TSV_EXPRESSION, persisted=True),
+        ),
+    )
+    op.create_index(
+        "idx_reports_search",
+        "incident_reports",
+        ["search_tsv"],
+        postgresql_using="gin",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_reports_search", table_name="incident_reports", if_exists=True)
+    op.drop_column("incident_reports", "search_tsv")
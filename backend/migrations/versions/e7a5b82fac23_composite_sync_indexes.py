@@ -0,0 +1,43 @@
+"""Replace last_updated_at indexes with (last_updated_at, id) sync indexes.
+
+Revision ID: e7a5b82fac23
+Revises: d6f4g71efb12
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a5b82fac23"
+down_revision: str | None = "d6f4g71efb12"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, old single-column index, new composite index)
+SYNC_INDEXES = [
+    ("dispatch_calls", "ix_dispatch_calls_last_updated_at", "idx_calls_sync"),
+    ("fire_calls", "ix_fire_calls_last_updated_at", "idx_fire_calls_sync"),
+    ("service_requests", "ix_service_requests_last_updated_at", "idx_service_requests_sync"),
+    ("traffic_crashes", "ix_traffic_crashes_last_updated_at", "idx_traffic_crashes_sync"),
+]
+
+
+def upgrade() -> None:
+    # A partial index bounded by NOW() isn't possible (index predicates must be
+    # immutable); dispatch_calls stays small through retention pruning instead.
+    for table, old_index, new_index in SYNC_INDEXES:
+        op.create_index(
+            new_index,
+            table,
+            ["last_updated_at", "id"],
+            if_not_exists=True,
+        )
+        op.drop_index(old_index, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    for table, old_index, new_index in SYNC_INDEXES:
+        op.create_index(old_index, table, ["last_updated_at"], if_not_exists=True)
+        op.drop_index(new_index, table_name=table, if_exists=True)
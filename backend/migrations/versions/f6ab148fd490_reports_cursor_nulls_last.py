@@ -0,0 +1,38 @@
+"""Rebuild the incident cursor index to match its NULLS LAST sort order.
+
+Revision ID: f6ab148fd490
+Revises: e5ab148fc389
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6ab148fd490"
+down_revision: str | None = "e5ab148fc389"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _create_cursor_index(report_datetime: str) -> None:
+    op.create_index(
+        "idx_reports_cursor",
+        "incident_reports",
+        [sa.text(report_datetime), sa.text("id DESC")],
+        if_not_exists=True,
+    )
+
+
+def upgrade() -> None:
+    # /incidents/search sorts by report_datetime DESC NULLS LAST; a plain DESC
+    # index sorts NULLs first, so the planner could not use it for the keyset scan
+    op.drop_index("idx_reports_cursor", table_name="incident_reports", if_exists=True)
+    _create_cursor_index("report_datetime DESC NULLS LAST")
+
+
+def downgrade() -> None:
+    op.drop_index("idx_reports_cursor", table_name="incident_reports", if_exists=True)
+    _create_cursor_index("report_datetime DESC")
@@ -0,0 +1,41 @@
+"""Add BRIN indexes on historical time-series columns.
+
+Revision ID: f8b6c93abd34
+Revises: e7a5b82fac23
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f8b6c93abd34"
+down_revision: str | None = "e7a5b82fac23"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index, table, column). dispatch_calls is deliberately excluded: it is small
+# and heavily updated, which is the wrong fit for BRIN.
+BRIN_INDEXES = [
+    ("idx_reports_date_brin", "incident_reports", "incident_date"),
+    ("idx_fire_calls_received_brin", "fire_calls", "received_at"),
+    ("idx_traffic_crashes_datetime_brin", "traffic_crashes", "collision_datetime"),
+]
+
+
+def upgrade() -> None:
+    for index, table, column in BRIN_INDEXES:
+        op.create_index(
+            index,
+            table,
+            [column],
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    for index, table, _column in BRIN_INDEXES:
+        op.drop_index(index, table_name=table, if_exists=True)
@@ -14,6 +14,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
+from app.cache import incident_lookup_cache, last_modified_cache
 from app.config import Settings
 from app.database import Base, get_db
 from app.main import app
@@ -73,6 +74,8 @@ async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
                 on_scene_at TIMESTAMP,
                 closed_at TIMESTAMP,
                 location TEXT,
+                lat REAL,
+                lng REAL,
                 location_text TEXT,
                 district TEXT,
                 disposition TEXT,
@@ -85,6 +88,7 @@ async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
                 source TEXT UNIQUE NOT NULL,
                 last_updated_at TIMESTAMP NOT NULL,
                 last_sync_at TIMESTAMP NOT NULL,
+                last_modified_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
                 record_count INTEGER DEFAULT 0
             )
         """))
@@ -101,6 +105,8 @@ async def db_session(async_engine) -> AsyncGenerator[AsyncSession, None]:
                 incident_time TIME,
                 report_datetime TIMESTAMP,
                 location TEXT,
+                lat REAL,
+                lng REAL,
                 location_text TEXT,
                 police_district TEXT,
                 analysis_neighborhood TEXT
@@ -124,6 +130,9 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    # Cached lookups would otherwise leak between tests
+    incident_lookup_cache.clear()
+    last_modified_cache.clear()
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
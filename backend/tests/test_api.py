@@ -1,6 +1,6 @@
 """Tests for API endpoints."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from sqlalchemy import text
@@ -192,6 +192,50 @@ class TestCallsEndpoints:
 
         assert response.status_code == 404
 
+    @pytest.mark.asyncio
+    async def test_list_calls_modified_after_prune(self, client, db_session):
+        """Test pruning moves Last-Modified on /calls but not /health last_sync."""
+        from app.services.ingestion import IngestionService
+
+        synced_at = datetime.now(UTC).replace(tzinfo=None) - timedelta(hours=1)
+        await db_session.execute(
+            text("""
+                INSERT INTO sync_checkpoints (
+                    source, last_updated_at, last_sync_at, last_modified_at
+                ) VALUES ('dispatch_calls', :synced_at, :synced_at, :synced_at)
+            """),
+            {"synced_at": synced_at},
+        )
+        await db_session.execute(
+            text("""
+                INSERT INTO dispatch_calls (cad_number, priority, received_at)
+                VALUES ('240180001', 'A', :received_at)
+            """),
+            {"received_at": synced_at - timedelta(hours=72)},
+        )
+        await db_session.commit()
+
+        response = await client.get("/api/v1/calls")
+        last_modified = response.headers["last-modified"]
+        response = await client.get(
+            "/api/v1/calls", headers={"If-Modified-Since": last_modified}
+        )
+        assert response.status_code == 304
+        last_sync = (await client.get("/health")).json()["dispatch_calls"]["last_sync"]
+
+        pruned = await IngestionService(db=db_session).prune_old_dispatch_calls()
+        assert pruned == 1
+
+        response = await client.get(
+            "/api/v1/calls", headers={"If-Modified-Since": last_modified}
+        )
+        assert response.status_code == 200
+        assert response.headers["last-modified"] != last_modified
+        assert response.json()["calls"] == []
+
+        response = await client.get("/health")
+        assert response.json()["dispatch_calls"]["last_sync"] == last_sync
+
     @requires_postgis
     @pytest.mark.asyncio
     async def test_bbox_endpoint_empty(self, client):
@@ -227,6 +271,33 @@ class TestCallsEndpoints:
         assert response.status_code == 422  # Validation error
 
 
+class TestTilesEndpoints:
+    """Tests for vector tile endpoints."""
+
+    @requires_postgis
+    @pytest.mark.asyncio
+    async def test_calls_tile_empty(self, client):
+        """Test an empty tile returns an MVT payload."""
+        response = await client.get("/api/v1/tiles/calls/14/2620/6332.mvt")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/vnd.mapbox-vector-tile"
+
+    @pytest.mark.asyncio
+    async def test_calls_tile_out_of_range(self, client):
+        """Test tile coordinates outside the zoom level's grid are rejected."""
+        response = await client.get("/api/v1/tiles/calls/2/4/0.mvt")
+
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_calls_tile_validation(self, client):
+        """Test zoom level validation."""
+        response = await client.get("/api/v1/tiles/calls/23/0/0.mvt")
+
+        assert response.status_code == 422
+
+
 class TestIncidentsEndpoints:
     """Tests for incident report endpoints."""
 
@@ -304,6 +375,46 @@ class TestIncidentsEndpoints:
         assert len(data["incidents"]) == 1
         assert data["incidents"][0]["police_district"] == "Southern"
 
+    @requires_postgis
+    @pytest.mark.asyncio
+    async def test_search_incidents_text_query(self, client, db_session):
+        """Test q matches whole words and a partially typed last word."""
+        now = datetime.now(UTC)
+        for i, category in enumerate(["Burglary", "Assault"]):
+            await db_session.execute(
+                text("""
+                    INSERT INTO incident_reports (
+                        incident_id, incident_category, report_datetime
+                    ) VALUES (
+                        :incident_id, :category, :report_datetime
+                    )
+                """),
+                {
+                    "incident_id": f"100000{i}",
+                    "category": category,
+                    "report_datetime": now,
+                },
+            )
+        await db_session.commit()
+
+        for q in ["burglary", "burg"]:
+            response = await client.get("/api/v1/incidents/search", params={"q": q})
+
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data["incidents"]) == 1
+            assert data["incidents"][0]["incident_category"] == "Burglary"
+
+    def test_prefix_tsquery(self):
+        """Test the prefix tsquery built from a search term."""
+        from app.routers.incidents import _prefix_tsquery
+
+        assert _prefix_tsquery("burg") == "burg:*"
+        assert _prefix_tsquery("car break-in") == "car & break & in:*"
+        assert _prefix_tsquery("'theft' | !") == "theft:*"
+        assert _prefix_tsquery("theft -vehicle") is None
+        assert _prefix_tsquery("!&|") is None
+
     @pytest.mark.asyncio
     async def test_categories_endpoint(self, client, db_session):
         """Test getting incident categories."""
@@ -361,26 +472,75 @@ class TestIncidentsEndpoints:
         data = response.json()
         assert set(data) == set(districts)
 
+    @pytest.mark.asyncio
+    async def test_categories_etag_not_modified(self, client):
+        """Test categories honours If-None-Match with a 304."""
+        response = await client.get("/api/v1/incidents/categories")
+        etag = response.headers["etag"]
+
+        response = await client.get(
+            "/api/v1/incidents/categories",
+            headers={"If-None-Match": etag},
+        )
+
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_search_incidents_not_modified_since_sync(self, client, db_session):
+        """Test search honours If-Modified-Since against the last sync."""
+        await db_session.execute(
+            text("""
+                INSERT INTO sync_checkpoints (
+                    source, last_updated_at, last_sync_at, last_modified_at
+                ) VALUES ('incident_reports', :synced_at, :synced_at, :synced_at)
+            """),
+            {"synced_at": datetime(2024, 1, 18, 10, 30, 0)},
+        )
+        await db_session.commit()
+
+        response = await client.get("/api/v1/incidents/search")
+        last_modified = response.headers["last-modified"]
+        assert last_modified == "Thu, 18 Jan 2024 10:30:00 GMT"
+
+        response = await client.get(
+            "/api/v1/incidents/search",
+            headers={"If-Modified-Since": last_modified},
+        )
+
+        assert response.status_code == 304
+
 
 class TestCursorEncoding:
     """Tests for cursor encoding/decoding utilities."""
 
     def test_encode_decode_cursor(self):
         """Test cursor roundtrip."""
-        from app.routers.calls import _decode_cursor, _encode_cursor
+        from app.pagination import decode_cursor, encode_cursor
 
         test_time = datetime(2024, 1, 18, 10, 30, 0)
         test_id = 12345
 
-        encoded = _encode_cursor(test_time, test_id)
-        decoded_time, decoded_id = _decode_cursor(encoded)
+        encoded = encode_cursor(test_time, test_id)
+        decoded_time, decoded_id = decode_cursor(encoded)
 
         assert decoded_time == test_time
         assert decoded_id == test_id
 
     def test_decode_invalid_cursor(self):
         """Test decoding invalid cursor."""
-        from app.routers.calls import _decode_cursor
+        from app.pagination import decode_cursor
 
         with pytest.raises(Exception):
-            _decode_cursor("invalid_cursor_string")
+            decode_cursor("invalid_cursor_string")
+
+    def test_encode_decode_aware_cursor(self):
+        """Test cursor roundtrip keeps timezone-aware timestamps in UTC."""
+        from app.pagination import decode_cursor, encode_cursor
+
+        test_time = datetime(2024, 1, 18, 10, 30, 0, 123456, tzinfo=UTC)
+
+        encoded = encode_cursor(test_time, 2**31)
+
+        assert "=" not in encoded
+        assert decode_cursor(encoded) == (test_time, 2**31)
@@ -0,0 +1,38 @@
+"""Tests for database engine configuration."""
+
+from sqlalchemy.pool import NullPool
+
+from app.config import Settings
+from app.database import _engine_options
+
+
+class TestEngineOptions:
+    """Tests for create_async_engine keyword arguments."""
+
+    def test_pgbouncer_mode(self):
+        """Test PgBouncer mode disables pooling and statement caches."""
+        options = _engine_options(Settings(db_pgbouncer=True))
+        connect_args = options["connect_args"]
+
+        assert options["poolclass"] is NullPool
+        assert "pool_size" not in options
+        assert connect_args["statement_cache_size"] == 0
+        assert connect_args["prepared_statement_cache_size"] == 0
+        assert connect_args["server_settings"]["jit"] == "off"
+
+        # Unique per statement, never asyncpg's per-connection counter names
+        name_func = connect_args["prepared_statement_name_func"]
+        first, second = name_func(), name_func()
+        assert first != second
+        assert first.startswith("__asyncpg_")
+        assert not first.startswith("__asyncpg_stmt_")
+
+    def test_pooled_mode(self):
+        """Test the default mode keeps a pool and prepared statement caches."""
+        options = _engine_options(Settings(db_pgbouncer=False, db_pool_size=7))
+        connect_args = options["connect_args"]
+
+        assert "poolclass" not in options
+        assert options["pool_size"] == 7
+        assert connect_args["statement_cache_size"] == 512
+        assert "prepared_statement_name_func" not in connect_args
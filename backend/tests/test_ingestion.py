@@ -32,6 +32,10 @@ class TestIngestionService:
         result = service._parse_datetime("2024-01-18 10:30:00")
         assert result is not None
 
+        # UTC designator
+        result = service._parse_datetime("2024-01-18T10:30:00.000Z")
+        assert result == datetime(2024, 1, 18, 10, 30, tzinfo=UTC)
+
     def test_parse_datetime_invalid(self, db_session):
         """Test parsing invalid datetime strings."""
         service = IngestionService(db=db_session)